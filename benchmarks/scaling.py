@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+""" Scaling benchmarks on synthetic chains
+
+    Grows one dimension of a synthetic chain at a time and reports load time,
+    memory and normalize latency, e.g.::
+
+        python3 benchmarks/scaling.py --dimension participants \\
+            --steps 10,100,1000
+"""
+import gc
+import time
+import shutil
+import tempfile
+import tracemalloc
+import click
+from bookiesports import BookieSports
+from bookiesports.normalize import IncidentsNormalizer
+from bookiesports.synthetic import generate_chain, generate_incidents
+
+DIMENSIONS = [
+    "sports",
+    "eventgroups",
+    "participants",
+    "aliases",
+    "rules",
+    "bettingmarketgroups",
+]
+
+
+def measure(sports_folder, chain, incidents_count):
+    """ Load ``chain`` from ``sports_folder`` and normalize incidents
+
+        :returns: dict of the measurements
+    """
+    base_folder = BookieSports.BASE_FOLDER
+    try:
+        gc.collect()
+        start = time.perf_counter()
+        BookieSports(chain, sports_folder=sports_folder, override_cache=True)
+        load = time.perf_counter() - start
+
+        # Tracing slows loading down, so memory is measured separately
+        BookieSports.CHAIN_CACHE.pop(chain, None)
+        gc.collect()
+        tracemalloc.start()
+        bookiesports = BookieSports(
+            chain, sports_folder=sports_folder, override_cache=True)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        incidents = generate_incidents(bookiesports, incidents_count)
+        normalizer = IncidentsNormalizer(chain, cache_size=0)
+        latencies = []
+        for incident in incidents:
+            start = time.perf_counter()
+            normalizer.normalize(incident)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+    finally:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        BookieSports.BASE_FOLDER = base_folder
+        BookieSports.CHAIN_CACHE.pop(chain, None)
+
+    return dict(
+        load=load,
+        memory=memory,
+        p50=latencies[len(latencies) // 2],
+        p99=latencies[int(len(latencies) * 0.99)],
+    )
+
+
+@click.command()
+@click.option(
+    "--dimension", type=click.Choice(DIMENSIONS), default="participants",
+    help="Dimension of the chain to grow")
+@click.option(
+    "--steps", default="10,100,1000",
+    help="Comma separated sizes of the grown dimension")
+@click.option("--sports", default=2)
+@click.option("--eventgroups", default=5)
+@click.option("--participants", default=20)
+@click.option("--aliases", default=3)
+@click.option("--rules", default=3)
+@click.option("--bettingmarketgroups", default=3)
+@click.option("--incidents", default=1000, help="Incidents to normalize")
+def main(dimension, steps, incidents, **sizes):
+    """ Report load time, memory and normalize latency per size
+    """
+    click.echo("{:>10} {:>12} {:>10} {:>12} {:>12} {:>12}".format(
+        dimension, "participants", "load [s]", "memory [MB]",
+        "p50 [us]", "p99 [us]"))
+    for step in [int(x) for x in steps.split(",")]:
+        sizes[dimension] = step
+        tmpdir = tempfile.mkdtemp()
+        try:
+            generate_chain(tmpdir, "synthetic", **sizes)
+            result = measure(tmpdir, "synthetic", incidents)
+        finally:
+            shutil.rmtree(tmpdir)
+        click.echo("{:>10} {:>12} {:>10.3f} {:>12.1f} {:>12.1f} {:>12.1f}".format(
+            step,
+            sizes["sports"] * sizes["eventgroups"] * sizes["participants"],
+            result["load"],
+            result["memory"] / 1e6,
+            result["p50"] * 1e6,
+            result["p99"] * 1e6))
+
+
+if __name__ == "__main__":
+    main()
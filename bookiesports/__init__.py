@@ -2,13 +2,17 @@ import os
 import sys
 import yaml
 import logging
+import threading
 import jsonschema
 import pkg_resources
 from dateutil import parser
 from .exceptions import SportsNotFoundError
-from glob import glob
+from .bundle import open_source, FolderSource
 log = logging.getLogger(__name__)
 
+#: Folders of a sport that hold one document per file
+DOCUMENT_FOLDERS = ("rules", "participants", "bettingmarketgroups")
+
 
 class BookieSports(dict):
     """ This class allows to read the data provided by bookiesports
@@ -41,12 +45,29 @@ class BookieSports(dict):
         :param string network: deprecated, please use chain
 
         It is possible to overload a custom sports_folder by providing it to
-        ``BookieSports`` as parameter.
+        ``BookieSports`` as parameter. Instead of a folder, ``sports_folder``
+        may also be a zip or tar archive of such a folder, or a bundle
+        created with :func:`bookiesports.bundle.pack`. Archives and bundles
+        are read in a single sequential pass without extracting them.
+
+        A chain may be defined as an overlay of another chain of the same
+        sports folder by naming it as ``base`` in its ``index.yaml``. The
+        chain folder then only holds what differs from the base (sports,
+        event groups, rules, participants or betting market groups), and
+        ``remove`` lists paths of the base to drop, e.g. ``Soccer/EPL``.
     """
 
     #: Singelton to store data and prevent rereading if BookieSports is
     #: instantiated multiple times
     CHAIN_CACHE = dict()
+
+    #: Indexes derived from the data in ``CHAIN_CACHE``, per chain. They are
+    #: rebuilt whenever the chain is reloaded
+    DERIVED_CACHE = dict()
+
+    #: Serializes loading chains and building derived indexes, which share
+    #: the class level folders and caches
+    LOAD_LOCK = threading.RLock()
 #
 #     #: Folder where the data is actually stored
 #     sports_folder = None
@@ -83,46 +104,74 @@ class BookieSports(dict):
 
         self.chain = chain.lower()
 
-        # Sports to look for chains
-        if "sports_folder" in kwargs and kwargs["sports_folder"]:
-            BookieSports.BASE_FOLDER = kwargs.pop("sports_folder")
-        BookieSports.SPORTS_FOLDER = os.path.join(
-            BookieSports.BASE_FOLDER,
-            self.chain
-        )
-
-        assert chain in BookieSports.list_chains(), "Unknown chain {}".format(network)
-
-        # Load schemata
-        if not BookieSports.JSON_SCHEMA:
-            BookieSports.schema = self._loadschema()
-
-        # Do not reload sports if already stored in data
-        if override_cache or BookieSports.CHAIN_CACHE.get(self.chain, None) is None:
-            # Load bundled sports
-            if not os.path.isdir(BookieSports.SPORTS_FOLDER):
-                # was it maybe a relative folder?
-                relative_sports_folder = os.path.join(
-                    self.chain
-                )
-                if not os.path.isdir(relative_sports_folder):
-                    raise SportsNotFoundError(
-                        "No bookiesports, found in {}".format(
-                            BookieSports.SPORTS_FOLDER)
+        with BookieSports.LOAD_LOCK:
+            # Sports to look for chains
+            if "sports_folder" in kwargs and kwargs["sports_folder"]:
+                BookieSports.BASE_FOLDER = kwargs.pop("sports_folder")
+            BookieSports.SPORTS_FOLDER = os.path.join(
+                BookieSports.BASE_FOLDER,
+                self.chain
+            )
+
+            assert chain in BookieSports.list_chains(), "Unknown chain {}".format(network)
+
+            self._source = open_source(BookieSports.BASE_FOLDER)
+
+            # Load schemata
+            if not BookieSports.JSON_SCHEMA:
+                BookieSports.JSON_SCHEMA = self._loadschema()
+            BookieSports.schema = BookieSports.JSON_SCHEMA
+
+            # Do not reload sports if already stored in data
+            loaded = False
+            previous = BookieSports.CHAIN_CACHE.get(self.chain)
+            if override_cache or BookieSports.CHAIN_CACHE.get(self.chain, None) is None:
+                # Load bundled sports
+                if not self._source.isdir(BookieSports.SPORTS_FOLDER):
+                    # was it maybe a relative folder?
+                    relative_sports_folder = os.path.join(
+                        self.chain
                     )
-                else:
-                    BookieSports.SPORTS_FOLDER = relative_sports_folder
-            BookieSports.CHAIN_CACHE[self.chain] = self._loadSports(BookieSports.SPORTS_FOLDER)
-
-        # Load sports
-        super(BookieSports, self).__init__(
-            BookieSports.CHAIN_CACHE[self.chain]
-        )
+                    if not os.path.isdir(relative_sports_folder):
+                        raise SportsNotFoundError(
+                            "No bookiesports, found in {}".format(
+                                BookieSports.SPORTS_FOLDER)
+                        )
+                    else:
+                        BookieSports.SPORTS_FOLDER = relative_sports_folder
+                        self._source = FolderSource(os.getcwd())
+                BookieSports.CHAIN_CACHE[self.chain] = self._loadSports(
+                    BookieSports.SPORTS_FOLDER, override_cache)
+                loaded = True
+
+            # Load sports
+            self._data = BookieSports.CHAIN_CACHE[self.chain]
+            super(BookieSports, self).__init__(self._data)
 
         self.index = self.pop("index")
 
-        # _tests
-        self._tests()
+        try:
+            # _tests
+            self._tests()
+
+            # Compile templates, so that broken ones fail loading
+            if loaded:
+                self.renderer
+        except Exception:
+            # Do not keep a chain that failed loading in the cache
+            if loaded:
+                self._uncache(previous)
+            raise
+
+    def _uncache(self, previous):
+        """ Put back the chain that was cached before this one was loaded
+        """
+        with BookieSports.LOAD_LOCK:
+            BookieSports.DERIVED_CACHE.pop(self.chain, None)
+            if previous is None:
+                BookieSports.CHAIN_CACHE.pop(self.chain, None)
+            else:
+                BookieSports.CHAIN_CACHE[self.chain] = previous
 
     @staticmethod
     def version():
@@ -149,9 +198,7 @@ class BookieSports(dict):
 
     @staticmethod
     def list_chains():
-        return [os.path.basename(network) for network in glob(
-            os.path.join(BookieSports.BASE_FOLDER, '*')
-        )]
+        return open_source(BookieSports.BASE_FOLDER).chains()
 
     @staticmethod
     def _clear():
@@ -176,6 +223,20 @@ class BookieSports(dict):
             log.error("The file {} is required but doesn't exist!".format(f))
             sys.exit(1)
 
+    def _loaddocument(self, f):
+        """ Load a document from the sports folder, archive or bundle
+
+            :param str f: Document location
+        """
+        try:
+            return self._source.load(f)
+        except yaml.YAMLError as exc:
+            log.error("Error in configuration file {}: {}".format(f, exc))
+            sys.exit(1)
+        except Exception:
+            log.error("The file {} is required but doesn't exist!".format(f))
+            sys.exit(1)
+
     def _loadschema(self):
         """ Load the validation schema
         """
@@ -214,6 +275,109 @@ class BookieSports(dict):
         """
         return self.index
 
+    def _derived(self, name, builder):
+        """ Return the index ``name`` of this chain, built by
+            ``builder(self)`` once per load of the chain
+        """
+        data = self._data
+        cached = BookieSports.DERIVED_CACHE.get(self.chain)
+        if cached is not None and cached[0] is data and name in cached[1]:
+            return cached[1][name]
+        outdated = self.__dict__.get("_outdated", {})
+        if name in outdated:
+            return outdated[name]
+        with BookieSports.LOAD_LOCK:
+            if BookieSports.CHAIN_CACHE.get(self.chain) is not data:
+                # The chain was reloaded since, what is built from the
+                # outdated data is kept with this instance only
+                outdated = self.__dict__.setdefault("_outdated", dict())
+                if name not in outdated:
+                    outdated[name] = builder(self)
+                return outdated[name]
+            cached = BookieSports.DERIVED_CACHE.get(self.chain)
+            if cached is None or cached[0] is not data:
+                cached = (data, dict())
+                BookieSports.DERIVED_CACHE[self.chain] = cached
+            if name not in cached[1]:
+                cached[1][name] = builder(self)
+            return cached[1][name]
+
+    @property
+    def renderer(self):
+        """ Compiled event names and betting market descriptions
+
+            :rtype: bookiesports.render.Renderer
+        """
+        from .render import Renderer
+        return self._derived("renderer", Renderer)
+
+    def alias_index(self, canonicalizer=None):
+        """ Search keys of all sports, event groups and participants
+
+            :param bookiesports.canonical.Canonicalizer canonicalizer: turns
+                names into keys
+            :rtype: bookiesports.index.AliasIndex
+        """
+        from .index import AliasIndex
+        from .canonical import DEFAULT
+
+        def build(bookiesports):
+            index = AliasIndex(canonicalizer)
+            index.add(bookiesports)
+            return index
+        return self._derived(("alias_index", canonicalizer or DEFAULT), build)
+
+    @property
+    def reverse_index(self):
+        """ Entities, their localized names and aliases by identifier
+
+            :rtype: bookiesports.index.ReverseIndex
+        """
+        from .index import ReverseIndex
+        return self._derived("reverse_index", ReverseIndex)
+
+    def lookup(self, type, identifier, sport=None):
+        """ Find an entity by its identifier
+
+            .. code-block:: python
+
+                entity = BookieSports("alice").lookup(
+                    "participant", "Boston Bruins", sport="Ice Hockey")
+                entity.names["sen"]  # 'BOS'
+                entity.aliases       # ('Boston Bruins', 'Boston Bruins', 'BOS')
+
+            :param str type: one of ``sport``, ``eventgroup``,
+                ``participant``, ``rule`` or ``bettingmarketgroup``
+            :param str identifier: identifier of the entity
+            :param str sport: identifier of the sport, for all types but
+                ``sport``
+            :rtype: bookiesports.index.Entity or ``None``
+        """
+        return self.reverse_index.get(type, identifier, sport)
+
+    def market_plan(self, sport, eventgroup):
+        """ The betting market groups of an event group, with their rules,
+            assets and compiled betting market descriptions, resolved once
+            per load of the chain
+
+            :param str sport: identifier or folder name of the sport
+            :param str eventgroup: identifier or folder name of the event
+                group
+            :rtype: bookiesports.plan.MarketPlan or ``None``
+        """
+        from .plan import MarketPlans
+        return self._derived("market_plans", MarketPlans).get(
+            sport, eventgroup)
+
+    @property
+    def timeline(self):
+        """ Creation windows of all event groups
+
+            :rtype: bookiesports.schedule.Timeline
+        """
+        from .schedule import Timeline
+        return self._derived("timeline", Timeline)
+
     @property
     def chain_id(self):
         return self.index["chain_id"]
@@ -225,21 +389,25 @@ class BookieSports(dict):
         """
         return self.chain
 
-    def _loadSports(self, network_folder):
+    def _loadSports(self, network_folder, override_cache=False):
         """ This loads all sports recursively from the ``sports/`` folder
+
+            :param bool override_cache: reload the base of an overlay chain
+                even if it is cached
         """
-        index = self._loadyaml(os.path.join(network_folder, "index.yaml"))
+        index = self._loaddocument(os.path.join(network_folder, "index.yaml"))
 
         # Validate
         jsonschema.validate(index, self.schema["network"])
 
+        if index.get("base"):
+            return self._loadOverlay(network_folder, index, override_cache)
+
         ret = dict()
         ret["index"] = index
 
-        for sportDir in glob(
-            os.path.join(network_folder, "*")
-        ):
-            if not os.path.isdir(sportDir):
+        for sportDir in self._source.children(network_folder):
+            if not self._source.isdir(sportDir):
                 continue
             sportname = os.path.basename(sportDir)
             sport = self._loadSport(sportDir)
@@ -249,7 +417,7 @@ class BookieSports(dict):
     def _loadSport(self, sportDir):
         """ Load an individual sport, recursively
         """
-        sport = self._loadyaml(os.path.join(sportDir, "index.yaml"))
+        sport = self._loaddocument(os.path.join(sportDir, "index.yaml"))
 
         # Validate
         jsonschema.validate(sport, self.schema["sport"])
@@ -257,75 +425,164 @@ class BookieSports(dict):
         # Load Eventgroups
         eventgroups = dict()
         for eventgroupname in sport["eventgroups"]:
-            eventgroupDir = os.path.join(sportDir, eventgroupname)
-            eventgroup = self._loadyaml(
-                os.path.join(eventgroupDir, "index.yaml"))
-
-            # Because yaml parses our times already and jsonschema cannot deal
-            # with it properly, we convert them to strings
-            for t in ["start_date", "finish_date"]:
-                if t in eventgroup:
-                    eventgroup[t] = str(eventgroup.get(t))
-            # Validate
-            jsonschema.validate(eventgroup, self.schema["eventgroup"])
-
-            for t in ["start_date", "finish_date"]:
-                if t in eventgroup:
-                    eventgroup[t] = parser.parse(eventgroup[t])
-
-            # Store in structure
-            eventgroups[eventgroupname] = eventgroup
-            eventgroups[eventgroupname]["sport_id"] = sport.get("id")
+            eventgroups[eventgroupname] = self._loadEventGroup(
+                os.path.join(sportDir, eventgroupname), sport)
         sport["eventgroups"] = eventgroups
 
         # Rules
-        rulesDir = os.path.join(sportDir, "rules")
-        rules = dict()
-        for ruleDir in glob(os.path.join(rulesDir, "*")):
-            if ".yaml" not in ruleDir:
-                continue
-            rulename = os.path.basename(ruleDir).replace(".yaml", "")
-            rule = self._loadyaml(ruleDir)
+        sport["rules"] = self._loadDocuments(
+            os.path.join(sportDir, "rules"), "rule")
 
-            # Validate
-            jsonschema.validate(rule, self.schema["rule"])
+        # participants
+        sport["participants"] = self._loadDocuments(
+            os.path.join(sportDir, "participants"), "participant")
 
-            rules[rulename] = rule
-        sport["rules"] = rules
+        # def_bmgs
+        sport["bettingmarketgroups"] = self._loadDocuments(
+            os.path.join(sportDir, "bettingmarketgroups"),
+            "bettingmarketgroup")
 
-        # participants
-        participantsDir = os.path.join(sportDir, "participants")
-        participants = dict()
-        for participantDir in glob(os.path.join(participantsDir, "*")):
-            if ".yaml" not in participantDir:
+        return sport
+
+    def _loadEventGroup(self, eventgroupDir, sport):
+        """ Load an individual event group of ``sport``
+        """
+        eventgroup = self._loaddocument(
+            os.path.join(eventgroupDir, "index.yaml"))
+
+        # Because yaml parses our times already and jsonschema cannot deal
+        # with it properly, we convert them to strings
+        for t in ["start_date", "finish_date"]:
+            if t in eventgroup:
+                eventgroup[t] = str(eventgroup.get(t))
+        # Validate
+        jsonschema.validate(eventgroup, self.schema["eventgroup"])
+
+        for t in ["start_date", "finish_date"]:
+            if t in eventgroup:
+                eventgroup[t] = parser.parse(eventgroup[t])
+
+        eventgroup["sport_id"] = sport.get("id")
+        return eventgroup
+
+    def _loadDocuments(self, folder, schema):
+        """ Load and validate all ``.yaml`` files of ``folder`` (rules,
+            participants or betting market groups), keyed by file name
+        """
+        documents = dict()
+        for path in self._source.children(folder):
+            if ".yaml" not in path:
                 continue
-            participant_name = os.path.basename(
-                participantDir).replace(".yaml", "")
-            participant = self._loadyaml(participantDir)
+            name = os.path.basename(path).replace(".yaml", "")
+            document = self._loaddocument(path)
 
             # Validate
-            jsonschema.validate(participant, self.schema["participant"])
+            jsonschema.validate(document, self.schema[schema])
 
-            participants[participant_name] = participant
-        sport["participants"] = participants
+            documents[name] = document
+        return documents
 
-        # def_bmgs
-        def_bmgsDir = os.path.join(sportDir, "bettingmarketgroups")
-        def_bmgs = dict()
-        for def_bmgDir in glob(os.path.join(def_bmgsDir, "*")):
-            if ".yaml" not in def_bmgDir:
+    def _loadOverlay(self, network_folder, index, override_cache=False):
+        """ Load a chain that is defined as a ``base`` chain plus deltas
+
+            The base chain is loaded (and validated) only once and shared
+            through ``CHAIN_CACHE``, unless ``override_cache`` reloads it. Everything the overlay folder does not
+            override is taken over from the base without copying; sports,
+            event groups and documents it does override are replaced in a
+            copy of the affected sport only.
+        """
+        base = index["base"].lower()
+        base_folder = os.path.join(os.path.dirname(network_folder), base)
+        loading = self.__dict__.setdefault("_loading_overlays", [])
+        if base in loading or \
+                os.path.abspath(base_folder) == os.path.abspath(network_folder):
+            raise SportsNotFoundError(
+                "Circular base chains: {}".format(" -> ".join(loading + [base])))
+        if override_cache or BookieSports.CHAIN_CACHE.get(base) is None:
+            if not self._source.isdir(base_folder):
+                raise SportsNotFoundError(
+                    "No bookiesports, found in {}".format(base_folder))
+            loading.append(base)
+            try:
+                BookieSports.CHAIN_CACHE[base] = self._loadSports(
+                    base_folder, override_cache)
+            finally:
+                loading.remove(base)
+        ret = dict(BookieSports.CHAIN_CACHE[base])
+        ret["index"] = index
+
+        for sportDir in self._source.children(network_folder):
+            if not self._source.isdir(sportDir):
                 continue
-            def_bmg_name = os.path.basename(def_bmgDir).replace(".yaml", "")
-            bmg = self._loadyaml(def_bmgDir)
+            sportname = os.path.basename(sportDir)
+            if sportname in ret:
+                ret[sportname] = self._overlaySport(sportDir, ret[sportname])
+            else:
+                ret[sportname] = self._loadSport(sportDir)
+
+        for path in index.get("remove") or []:
+            parts = path.strip("/").split("/")
+            if len(parts) > 3 or (
+                    len(parts) == 3 and parts[1] not in DOCUMENT_FOLDERS):
+                raise SportsNotFoundError(
+                    "Cannot remove {}, expected a sport, an event group or "
+                    "a file in one of {}".format(
+                        path, ", ".join(DOCUMENT_FOLDERS)))
+            sportname = parts[0]
+            if sportname not in ret:
+                continue
+            if len(parts) == 1:
+                ret.pop(sportname)
+                continue
+            sport = ret[sportname] = dict(ret[sportname])
+            if len(parts) == 2:
+                sport["eventgroups"] = dict(sport["eventgroups"])
+                sport["eventgroups"].pop(parts[1], None)
+            else:
+                sport[parts[1]] = dict(sport.get(parts[1], {}))
+                sport[parts[1]].pop(parts[2].replace(".yaml", ""), None)
+        return ret
 
-            # Validate
-            jsonschema.validate(bmg, self.schema["bettingmarketgroup"])
+    def _overlaySport(self, sportDir, base):
+        """ Apply the deltas in ``sportDir`` to the sport ``base``
+        """
+        sport_index = os.path.join(sportDir, "index.yaml")
+        if self._source.isfile(sport_index):
+            sport = self._loaddocument(sport_index)
 
             # Validate
-            jsonschema.validate(participant, self.schema["participant"])
-            def_bmgs[def_bmg_name] = bmg
+            jsonschema.validate(sport, self.schema["sport"])
+            eventgroupnames = sport["eventgroups"]
+        else:
+            sport = dict(base)
+            eventgroupnames = list(base["eventgroups"])
+
+        eventgroups = dict()
+        for eventgroupname in eventgroupnames:
+            eventgroupDir = os.path.join(sportDir, eventgroupname)
+            if self._source.isfile(os.path.join(eventgroupDir, "index.yaml")):
+                eventgroup = self._loadEventGroup(eventgroupDir, sport)
+            elif eventgroupname in base["eventgroups"]:
+                eventgroup = base["eventgroups"][eventgroupname]
+                if eventgroup.get("sport_id") != sport.get("id"):
+                    eventgroup = dict(eventgroup)
+                    eventgroup["sport_id"] = sport.get("id")
+            else:
+                raise SportsNotFoundError(
+                    "Event group {} is neither in {} nor in its base".format(
+                        eventgroupname, sportDir))
+            eventgroups[eventgroupname] = eventgroup
+        sport["eventgroups"] = eventgroups
 
-        sport["bettingmarketgroups"] = def_bmgs
+        for folder, schema in [
+            ("rules", "rule"),
+            ("participants", "participant"),
+            ("bettingmarketgroups", "bettingmarketgroup")
+        ]:
+            documents = dict(base.get(folder, {}))
+            documents.update(self._loadDocuments(
+                os.path.join(sportDir, folder), schema))
+            sport[folder] = documents
 
         return sport
 
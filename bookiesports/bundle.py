@@ -0,0 +1,252 @@
+import os
+import json
+import gzip
+import yaml
+import tarfile
+import zipfile
+import threading
+from glob import glob
+from .exceptions import SportsNotFoundError
+
+#: First line of a packed bundle file
+BUNDLE_MAGIC = b"BOOKIESPORTS-BUNDLE 1\n"
+
+
+class FolderSource(object):
+    """ Reads sports from a folder on disk (the default layout)
+
+        :param str path: folder that holds one subfolder per chain
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def chains(self):
+        return [os.path.basename(network) for network in glob(
+            os.path.join(self.path, '*')
+        )]
+
+    def isdir(self, path):
+        return os.path.isdir(path)
+
+    def isfile(self, path):
+        return os.path.isfile(path)
+
+    def children(self, path):
+        return glob(os.path.join(path, "*"))
+
+    def documents(self, path):
+        """ Iterate over all YAML documents below ``path``
+        """
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for f in sorted(files):
+                if f.endswith(".yaml"):
+                    yield os.path.join(root, f)
+
+    def load(self, path):
+        with open(path, encoding="utf-8") as fid:
+            return yaml.safe_load(fid)
+
+
+class _MemberSource(object):
+    """ Common base for sources that hold all their documents in memory
+        after reading the file once, sequentially.
+
+        Paths handed to the methods are ``os.path.join(<file>, ...)`` so that
+        :class:`bookiesports.BookieSports` can treat the file like a folder.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._members = dict()
+        self._dirs = set()
+        self._read()
+        self._strip_root()
+        for name in self._members:
+            parts = name.split("/")
+            for i in range(1, len(parts)):
+                self._dirs.add("/".join(parts[:i]))
+
+    def _read(self):
+        raise NotImplementedError
+
+    def _strip_root(self):
+        """ Archives are often created from the parent of the chain folders,
+            in which case everything lives below a single top folder
+        """
+        tops = set(name.split("/")[0] for name in self._members)
+        if len(tops) != 1:
+            return
+        top = tops.pop()
+        if top + "/index.yaml" in self._members:
+            return
+        self._members = {
+            name[len(top) + 1:]: data
+            for name, data in self._members.items()
+            if name.startswith(top + "/")
+        }
+
+    def _relative(self, path):
+        path = os.path.abspath(path)
+        root = os.path.abspath(self.path)
+        if path == root:
+            return ""
+        prefix = root + os.sep
+        if not path.startswith(prefix):
+            raise SportsNotFoundError(
+                "{} is not part of {}".format(path, self.path))
+        return path[len(prefix):].replace(os.sep, "/").strip("/")
+
+    def chains(self):
+        return sorted(set(
+            name.split("/")[0] for name in self._members if "/" in name
+        ))
+
+    def isdir(self, path):
+        rel = self._relative(path)
+        return rel == "" or rel in self._dirs
+
+    def isfile(self, path):
+        return self._relative(path) in self._members
+
+    def children(self, path):
+        rel = self._relative(path)
+        prefix = rel + "/" if rel else ""
+        names = set()
+        for name in list(self._members) + list(self._dirs):
+            if name.startswith(prefix) and name != rel:
+                names.add(name[len(prefix):].split("/")[0])
+        return [os.path.join(path, name) for name in sorted(names)]
+
+    def documents(self, path):
+        rel = self._relative(path)
+        prefix = rel + "/" if rel else ""
+        for name in sorted(self._members):
+            if name.startswith(prefix):
+                yield os.path.join(path, *name[len(prefix):].split("/"))
+
+    def load(self, path):
+        return self._parse(self._members[self._relative(path)])
+
+    def _parse(self, data):
+        return yaml.safe_load(data.decode("utf-8"))
+
+
+class ZipSource(_MemberSource):
+    """ Reads sports from a zip archive without extracting it
+    """
+
+    def _read(self):
+        with zipfile.ZipFile(self.path) as archive:
+            for info in archive.infolist():
+                if info.filename.endswith(".yaml"):
+                    self._members[info.filename.strip("/")] = \
+                        archive.read(info)
+
+
+class TarSource(_MemberSource):
+    """ Reads sports from a (compressed) tar archive in one sequential pass
+    """
+
+    def _read(self):
+        with tarfile.open(self.path, "r|*") as archive:
+            for info in archive:
+                if info.isfile() and info.name.endswith(".yaml"):
+                    name = info.name
+                    if name.startswith("./"):
+                        name = name[2:]
+                    self._members[name.strip("/")] = \
+                        archive.extractfile(info).read()
+
+
+class BundleSource(_MemberSource):
+    """ Reads sports from a bundle written by :func:`pack`
+
+        A bundle is a gzip compressed file that starts with
+        :data:`BUNDLE_MAGIC` followed by one line per document: its path,
+        a tab and the already parsed document as JSON. Loading a
+        bundle therefore needs neither a YAML parser nor a directory walk.
+    """
+
+    def _read(self):
+        with gzip.open(self.path, "rb") as fid:
+            if fid.readline() != BUNDLE_MAGIC:
+                raise SportsNotFoundError(
+                    "{} is not a bookiesports bundle".format(self.path))
+            for line in fid:
+                path, _ = line.split(b"\t", 1)
+                self._members[path.decode("utf-8")] = line
+
+    def _parse(self, data):
+        return json.loads(data.decode("utf-8").split("\t", 1)[1])
+
+
+def is_bundle(path):
+    try:
+        with gzip.open(path, "rb") as fid:
+            return fid.read(len(BUNDLE_MAGIC)) == BUNDLE_MAGIC
+    except (IOError, OSError, EOFError):
+        return False
+
+
+_SOURCES = dict()
+_SOURCES_LOCK = threading.Lock()
+
+
+def open_source(path):
+    """ Return the source for ``path``, which may be a folder, a zip or tar
+        archive or a bundle. Archives are only read once per modification.
+    """
+    if not os.path.isfile(path):
+        return FolderSource(path)
+    stat = os.stat(path)
+    key = (os.path.realpath(path), stat.st_mtime, stat.st_size)
+    with _SOURCES_LOCK:
+        if key not in _SOURCES:
+            if zipfile.is_zipfile(path):
+                source = ZipSource(path)
+            elif is_bundle(path):
+                source = BundleSource(path)
+            elif tarfile.is_tarfile(path):
+                source = TarSource(path)
+            else:
+                raise SportsNotFoundError(
+                    "Unknown sports archive {}".format(path))
+            for stale in [k for k in _SOURCES if k[0] == key[0]]:
+                del _SOURCES[stale]
+            _SOURCES[key] = source
+        return _SOURCES[key]
+
+
+def pack(sports_folder, filename, chains=None):
+    """ Pack chains into a single bundle file
+
+        :param str sports_folder: folder (or archive) holding the chains
+        :param str filename: location of the bundle to write
+        :param list chains: chains to pack, defaults to all
+    """
+    source = open_source(sports_folder)
+    if chains is None:
+        chains = [c for c in source.chains()
+                  if source.isdir(os.path.join(sports_folder, c))]
+    count = 0
+    with gzip.open(filename, "wb") as fid:
+        fid.write(BUNDLE_MAGIC)
+        for chain in chains:
+            chain_folder = os.path.join(sports_folder, chain)
+            if not source.isdir(chain_folder):
+                raise SportsNotFoundError(
+                    "No bookiesports, found in {}".format(chain_folder))
+            for path in source.documents(chain_folder):
+                name = os.path.relpath(path, sports_folder).replace(
+                    os.sep, "/")
+                fid.write(name.encode("utf-8") + b"\t")
+                fid.write(json.dumps(
+                    source.load(path),
+                    default=str,
+                    ensure_ascii=False
+                ).encode("utf-8"))
+                fid.write(b"\n")
+                count += 1
+    return count
@@ -0,0 +1,67 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+#: Statistics of a :class:`LRUCache`, same fields as
+#: :func:`functools.lru_cache` reports
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LRUCache(object):
+    """ Bounded, thread-safe mapping that evicts the least recently used
+        entry once ``maxsize`` entries are stored
+
+        :param int maxsize: maximum number of entries, ``0`` disables caching
+    """
+
+    #: Returned by :meth:`get` if the key is not cached
+    MISSING = object()
+
+    def __init__(self, maxsize=1024):
+        assert maxsize >= 0, "maxsize must not be negative"
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=MISSING):
+        """ Return the cached value for ``key`` and count a hit, or return
+            ``default`` and count a miss
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """ Drop all entries and reset the statistics
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
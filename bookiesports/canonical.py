@@ -0,0 +1,111 @@
+import re
+import unicodedata
+
+#: Replaced anywhere in a name, before punctuation is removed
+SUBSTITUTIONS = {
+    "&": "and",
+}
+
+#: Replaced when they appear as a whole word
+TOKENS = {
+    "utd": "united",
+}
+
+_PUNCTUATION = re.compile(r"[\W_]+", re.UNICODE)
+
+
+class Canonicalizer(object):
+    """ Turns names into the keys they are matched by
+
+        With all steps enabled, ``"Bayern München"`` and ``"bayern munchen"``
+        as well as ``"Brighton & Hove Albion"`` and
+        ``"Brighton and Hove Albion"`` end up with the same key.
+
+        :param bool fold_unicode: apply unicode NFKD normalization
+        :param bool strip_accents: drop combining characters (accents)
+        :param bool casefold: use ``str.casefold`` instead of ``str.lower``
+        :param bool strip_punctuation: treat punctuation as whitespace
+        :param dict substitutions: strings to replace anywhere in a name
+        :param dict tokens: words to replace by other words
+    """
+
+    def __init__(
+        self,
+        fold_unicode=True,
+        strip_accents=True,
+        casefold=True,
+        strip_punctuation=True,
+        substitutions=None,
+        tokens=None,
+    ):
+        self.fold_unicode = fold_unicode
+        self.strip_accents = strip_accents
+        self.casefold = casefold
+        self.strip_punctuation = strip_punctuation
+        self.substitutions = dict(
+            SUBSTITUTIONS if substitutions is None else substitutions)
+        self.tokens = dict(TOKENS if tokens is None else tokens)
+
+    def config(self):
+        """ The settings of this canonicalizer, as keyword arguments
+        """
+        return dict(
+            fold_unicode=self.fold_unicode,
+            strip_accents=self.strip_accents,
+            casefold=self.casefold,
+            strip_punctuation=self.strip_punctuation,
+            substitutions=self.substitutions,
+            tokens=self.tokens,
+        )
+
+    def _key(self):
+        return (
+            self.fold_unicode,
+            self.strip_accents,
+            self.casefold,
+            self.strip_punctuation,
+            tuple(sorted(self.substitutions.items())),
+            tuple(sorted(self.tokens.items())),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, Canonicalizer):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __call__(self, name):
+        if self.fold_unicode or self.strip_accents:
+            name = unicodedata.normalize("NFKD", name)
+        if self.strip_accents:
+            name = "".join(c for c in name if not unicodedata.combining(c))
+        name = name.casefold() if self.casefold else name.lower()
+        for old, new in self.substitutions.items():
+            if old in name:
+                name = name.replace(old, " " + new + " ")
+        if self.strip_punctuation:
+            name = _PUNCTUATION.sub(" ", name)
+        words = name.split()
+        if self.tokens:
+            words = [self.tokens.get(word, word) for word in words]
+        return " ".join(words)
+
+
+#: Used by the normalizers unless they are given a different one
+DEFAULT = Canonicalizer()
+
+#: Only ignores case and differences in whitespace
+SIMPLE = Canonicalizer(
+    fold_unicode=False,
+    strip_accents=False,
+    casefold=False,
+    strip_punctuation=False,
+    substitutions={},
+    tokens={},
+)
@@ -57,5 +57,78 @@ def list():
         click.echo("- {}".format(sport))
 
 
+@main.command()
+@click.option("--network", default=DEFAULT_NETWORK)
+@click.option("--sports-folder", default=None)
+@click.argument("filename")
+def export(network, sports_folder, filename):
+    """ Export a chain into an indexed SQLite database
+    """
+    from .sqlite import export
+    export(
+        BookieSports(network, sports_folder=sports_folder),
+        filename
+    )
+    click.echo("Exported {} to {}".format(network, filename))
+
+
+@main.command()
+@click.option("--sports-folder", default=BookieSports.BASE_FOLDER)
+@click.option("--chain", multiple=True)
+@click.argument("filename")
+def pack(sports_folder, chain, filename):
+    """ Pack chains into a single bundle file
+    """
+    from .bundle import pack
+    count = pack(sports_folder, filename, chains=chain or None)
+    click.echo("Packed {} documents into {}".format(count, filename))
+
+
+@main.command()
+@click.option("--network", multiple=True, default=[DEFAULT_NETWORK])
+@click.option("--sports-folder", default=None)
+@click.option("--host", default="127.0.0.1")
+@click.option("--port", default=8010)
+def serve(network, sports_folder, host, port):
+    """ Serve lookups and normalization of chains over HTTP
+    """
+    from .server import serve
+    for chain in network:
+        BookieSports(chain, sports_folder=sports_folder)
+    serve(network, host=host, port=port)
+
+
+@main.command()
+@click.option("--network", default=DEFAULT_NETWORK)
+@click.option("--sports-folder", default=None)
+@click.option("--incidents", type=click.Path(exists=True),
+              help="JSON (lines) file of incidents to normalize")
+@click.option("--profiler", type=click.Choice(["cprofile", "sample"]),
+              default="cprofile")
+@click.option("--interval", default=0.001,
+              help="Seconds between samples of the sampling profiler")
+@click.option("--top", default=20, help="Number of hot functions to list")
+@click.option("--stacks", type=click.Path(),
+              help="Write collapsed stacks (sampling profiler only)")
+def profile(network, sports_folder, incidents, profiler, interval, top,
+            stacks):
+    """ Profile loading a chain and normalizing incidents
+    """
+    from .profiling import profile_chain, read_incidents
+    if stacks and profiler != "sample":
+        raise click.UsageError("--stacks needs --profiler sample")
+    report = profile_chain(
+        network,
+        sports_folder=sports_folder,
+        incidents=read_incidents(incidents) if incidents else None,
+        profiler=profiler,
+        interval=interval)
+    click.echo(report.format(top))
+    if stacks:
+        with open(stacks, "w") as fid:
+            fid.write(report.collapsed())
+        click.echo("Collapsed stacks written to {}".format(stacks))
+
+
 if __name__ == "__main__":
     main()
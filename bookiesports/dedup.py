@@ -0,0 +1,131 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+from .index import timestamp
+
+#: Statistics of an :class:`IncidentDeduplicator`, ``expired`` counts the
+#: incidents forgotten because of the time or size window
+DedupInfo = namedtuple(
+    "DedupInfo", ["passed", "dropped", "merged", "expired", "currsize"])
+
+
+def event_key(incident):
+    """ Compact key of the event a normalized incident belongs to
+
+        The key is a 16 character hex digest of the sport, event group,
+        home and away identifiers and the start time (as UTC timestamp, so
+        that differently formatted times of the same instant match). It is
+        stable across processes and runs.
+
+        :param dict incident: normalized incident
+        :rtype: str
+    """
+    id = incident["id"]
+    fields = [
+        id["sport"],
+        id["event_group_name"],
+        id["home"],
+        id["away"],
+        "{:.0f}".format(timestamp(id["start_time"])),
+    ]
+    return hashlib.sha1(
+        "\x1f".join(fields).encode("utf-8")).hexdigest()[:16]
+
+
+class IncidentDeduplicator(object):
+    """ Normalizes incidents and suppresses copies of incidents seen before
+
+        Two incidents are copies if they normalize to the same event (see
+        :func:`event_key`) and have the same ``call``, no matter how the
+        provider spelled the names. Incidents are remembered for ``window``
+        seconds after they were first seen, and at most ``max_size`` of them
+        are remembered.
+
+        Copies are dropped. If ``merge`` is given, it is called with the
+        first incident and the copy instead, e.g. to record the providers
+        that reported the incident.
+
+        .. code-block:: python
+
+            deduplicator = IncidentDeduplicator(IncidentsNormalizer("alice"))
+            for incident in incidents:
+                normalized = deduplicator.process(incident)
+                if normalized is not None:
+                    forward(normalized)
+
+        :param IncidentsNormalizer normalizer: normalizes the incidents
+        :param float window: seconds an incident is remembered
+        :param int max_size: maximum number of remembered incidents
+        :param callable merge: ``merge(first, copy)``, called for copies
+        :param callable clock: returns the current time in seconds
+    """
+
+    def __init__(
+        self,
+        normalizer,
+        window=3600,
+        max_size=100000,
+        merge=None,
+        clock=time.monotonic,
+    ):
+        assert max_size > 0, "max_size must be positive"
+        self.normalizer = normalizer
+        self.window = window
+        self.max_size = max_size
+        self.merge = merge
+        self.clock = clock
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+        self.passed = 0
+        self.dropped = 0
+        self.merged = 0
+        self.expired = 0
+
+    def _expire(self, now):
+        while self._seen:
+            when = next(iter(self._seen.values()))[0]
+            if now - when < self.window and len(self._seen) <= self.max_size:
+                break
+            self._seen.popitem(last=False)
+            self.expired += 1
+
+    def process(self, incident, errorIfNotFound=False):
+        """ Normalize ``incident``
+
+            :returns: the normalized incident, or ``None`` if it is a copy of
+                an incident seen within the window
+        """
+        normalized = self.normalizer.normalize(incident, errorIfNotFound)
+        key = (event_key(normalized), normalized.get("call"))
+        with self._lock:
+            now = self.clock()
+            self._expire(now)
+            seen = self._seen.get(key)
+            if seen is None:
+                self._seen[key] = (now, normalized)
+                self._expire(now)
+                self.passed += 1
+                return normalized
+            if self.merge is None:
+                self.dropped += 1
+            else:
+                self.merge(seen[1], normalized)
+                self.merged += 1
+        return None
+
+    def clear(self):
+        """ Forget all incidents and reset the statistics
+        """
+        with self._lock:
+            self._seen.clear()
+            self.passed = self.dropped = self.merged = self.expired = 0
+
+    def info(self):
+        with self._lock:
+            return DedupInfo(
+                self.passed, self.dropped, self.merged, self.expired,
+                len(self._seen))
+
+    def __len__(self):
+        return len(self._seen)
@@ -1,2 +1,18 @@
 class SportsNotFoundError(Exception):
     pass
+
+
+class TemplateError(Exception):
+    pass
+
+
+class InvalidIncidentError(Exception):
+    """ An incident does not match the incident schema, ``errors`` holds
+        the :class:`bookiesports.validate.IncidentError` found
+    """
+
+    def __init__(self, errors):
+        Exception.__init__(self, "; ".join(
+            "{}: {}".format(".".join(map(str, e.path)) or "incident", e.message)
+            for e in errors))
+        self.errors = errors
@@ -0,0 +1,327 @@
+import calendar
+from types import MappingProxyType
+from collections import namedtuple
+from datetime import datetime
+from . import datestring, canonical
+
+
+def search_keys(entity):
+    """ All strings (aliases, internationalized names and identifier) an
+        entity can be found by, together with where they come from
+    """
+    keys = []
+    for alias in (entity.get("aliases") or []):
+        keys.append(("alias", alias))
+    for name in entity.get("name", {}).values():
+        keys.append(("name", name))
+    if entity.get("identifier"):
+        keys.append(("identifier", entity["identifier"]))
+    return keys
+
+
+def timestamp(value):
+    """ Convert a date into a UNIX timestamp, naive dates are treated as UTC
+    """
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        value = datestring.string_to_date(str(value))
+    if value.tzinfo is None:
+        return calendar.timegm(value.timetuple())
+    return value.timestamp()
+
+
+class Entry(object):
+    """ One indexed sport, event group or participant, shared by all chains
+        that contain an identical copy of it
+
+        :param str identifier: the normalized identifier
+        :param float start_date: start of an event group (UNIX timestamp)
+        :param float finish_date: end of an event group (UNIX timestamp)
+    """
+
+    __slots__ = ["identifier", "start_date", "finish_date", "positions"]
+
+    def __init__(self, identifier, start_date=None, finish_date=None):
+        self.identifier = identifier
+        self.start_date = start_date
+        self.finish_date = finish_date
+        #: position of this entry per chain, in load order of that chain
+        self.positions = dict()
+
+    @property
+    def chains(self):
+        return frozenset(self.positions)
+
+    def runs_at(self, when):
+        if self.start_date is not None and when < self.start_date:
+            return False
+        if self.finish_date is not None and self.finish_date < when:
+            return False
+        return True
+
+
+class AliasIndex(object):
+    """ Maps search keys of sports, event groups and participants of one or
+        more chains to their identifiers
+
+        Entities that are identical in several chains are stored once and
+        annotated with the chains they belong to, so that a single probe
+        answers the lookup for all chains.
+
+        All names are turned into keys by ``canonicalizer`` once, when they
+        are added. A lookup canonicalizes the name it is given and probes a
+        hash table.
+
+        .. code-block:: python
+
+            index = AliasIndex()
+            index.add(BookieSports("alice"))
+            index.add(BookieSports("beatrice"))
+            index.sport("Hockey")
+            # {'alice': 'Ice Hockey', 'beatrice': 'Ice Hockey'}
+
+        :param bookiesports.canonical.Canonicalizer canonicalizer: turns
+            names into keys, defaults to :data:`bookiesports.canonical.DEFAULT`
+    """
+
+    def __init__(self, canonicalizer=None):
+        self.canonicalizer = canonicalizer or canonical.DEFAULT
+        self.chains = []
+        self._sports = dict()
+        self._eventgroups = dict()
+        self._participants = dict()
+        self._entries = dict()
+
+    def _entry(self, fingerprint, chain, position, *args):
+        """ Return the shared entry for ``fingerprint`` and register
+            ``chain``
+        """
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            entry = self._entries[fingerprint] = Entry(*args)
+        entry.positions.setdefault(chain, position)
+        return entry
+
+    def _register(self, table, scope, entity, entry):
+        keys = set(
+            self.canonicalizer(name) for source, name in search_keys(entity))
+        for key in keys:
+            entries = table.setdefault((scope, key), [])
+            if entry not in entries:
+                entries.append(entry)
+
+    def add(self, bookiesports):
+        """ Index a loaded chain
+
+            :param BookieSports bookiesports: the loaded chain
+        """
+        chain = bookiesports.chain
+        assert chain not in self.chains, "Chain {} indexed twice".format(chain)
+        self.chains.append(chain)
+
+        for position, sport in enumerate(bookiesports.values()):
+            identifier = sport["identifier"]
+            keys = tuple(sorted(search_keys(sport)))
+            entry = self._entry(
+                ("sport", identifier, keys), chain, position, identifier)
+            self._register(self._sports, None, sport, entry)
+
+            for egposition, eventgroup in enumerate(
+                    sport["eventgroups"].values()):
+                start_date = timestamp(eventgroup.get("start_date"))
+                finish_date = timestamp(eventgroup.get("finish_date"))
+                keys = tuple(sorted(search_keys(eventgroup)))
+                entry = self._entry(
+                    ("eventgroup", identifier, eventgroup["identifier"],
+                     start_date, finish_date, keys),
+                    chain, egposition,
+                    eventgroup["identifier"], start_date, finish_date)
+                self._register(
+                    self._eventgroups, identifier, eventgroup, entry)
+
+            ppos = 0
+            for participants in sport["participants"].values():
+                for participant in participants["participants"]:
+                    try:
+                        pidentifier = participant["identifier"]
+                    except KeyError:
+                        pidentifier = participant["name"]["en"]
+                    keys = tuple(sorted(search_keys(participant)))
+                    entry = self._entry(
+                        ("participant", identifier, pidentifier, keys),
+                        chain, ppos, pidentifier)
+                    self._register(
+                        self._participants, identifier, participant, entry)
+                    ppos += 1
+
+    @staticmethod
+    def _first(entries, chain, when=None):
+        best = None
+        for entry in entries:
+            position = entry.positions.get(chain)
+            if position is None:
+                continue
+            if when is not None and not entry.runs_at(when):
+                continue
+            if best is None or position < best[0]:
+                best = (position, entry.identifier)
+        if best is not None:
+            return best[1]
+
+    def _lookup(self, table, scope, name, chains, when=None):
+        entries = table.get((scope, self.canonicalizer(name)), ())
+        return {
+            chain: self._first(entries, chain, when)
+            for chain in chains
+        }
+
+    def sport(self, name, chains=None):
+        """ Identifier of the sport known as ``name`` per chain (``None``
+            where it is unknown)
+        """
+        return self._lookup(
+            self._sports, None, name, chains or self.chains)
+
+    def eventgroup(self, sport_identifier, name, start_time, chains=None):
+        """ Identifier of the event group known as ``name`` that runs at
+            ``start_time`` per chain (``None`` where it is unknown)
+        """
+        when = timestamp(datestring.string_to_date(start_time))
+        return self._lookup(
+            self._eventgroups, sport_identifier, name,
+            chains or self.chains, when)
+
+    def participant(self, sport_identifier, name, chains=None):
+        """ Identifier of the participant known as ``name`` per chain
+            (``None`` where it is unknown)
+        """
+        return self._lookup(
+            self._participants, sport_identifier, name,
+            chains or self.chains)
+
+    def __len__(self):
+        """ Number of distinct indexed entries
+        """
+        return len(self._entries)
+
+
+#: Types of entities known to :class:`ReverseIndex`
+ENTITY_TYPES = (
+    "sport",
+    "eventgroup",
+    "participant",
+    "rule",
+    "bettingmarketgroup",
+)
+
+#: An entity of a chain. ``names`` maps languages to names (for betting
+#: market groups, their description), ``aliases`` holds the provider aliases
+#: and ``data`` the entity as loaded.
+Entity = namedtuple(
+    "Entity", ["type", "sport", "identifier", "names", "aliases", "data"])
+
+
+def _entity(type, sport, identifier, names, data):
+    return Entity(
+        type, sport, identifier,
+        MappingProxyType(dict(
+            (language, name) for language, name in (names or {}).items()
+            if isinstance(name, str)
+        )),
+        tuple(data.get("aliases") or []),
+        data)
+
+
+class ReverseIndex(object):
+    """ Maps identifiers to entities, their localized names and aliases
+
+        Sports are found by their identifier or folder name. All other
+        entities are found within a sport by their identifier or, for event
+        groups, rules and betting market groups, by their folder or file
+        name.
+
+        .. code-block:: python
+
+            index = BookieSports("alice").reverse_index
+            index.get("participant", "Boston Bruins", sport="Ice Hockey")
+
+        :param BookieSports bookiesports: the loaded chain
+    """
+
+    def __init__(self, bookiesports):
+        self._entities = dict((type, dict()) for type in ENTITY_TYPES)
+
+        for sportname, sport in bookiesports.items():
+            identifier = sport["identifier"]
+            entity = _entity("sport", None, identifier, sport["name"], sport)
+            self._add("sport", None, [identifier, sportname], entity)
+            sport_keys = [identifier, sportname]
+
+            for name, eventgroup in sport["eventgroups"].items():
+                entity = _entity(
+                    "eventgroup", identifier, eventgroup["identifier"],
+                    eventgroup["name"], eventgroup)
+                self._add(
+                    "eventgroup", sport_keys,
+                    [eventgroup["identifier"], name], entity)
+
+            for participants in sport["participants"].values():
+                for participant in participants["participants"]:
+                    pidentifier = participant.get(
+                        "identifier", participant["name"]["en"])
+                    entity = _entity(
+                        "participant", identifier, pidentifier,
+                        participant["name"], participant)
+                    self._add("participant", sport_keys, [pidentifier], entity)
+
+            for name, rule in sport["rules"].items():
+                entity = _entity(
+                    "rule", identifier, rule["identifier"],
+                    rule.get("name"), rule)
+                self._add(
+                    "rule", sport_keys, [rule["identifier"], name], entity)
+
+            for name, bmg in sport["bettingmarketgroups"].items():
+                entity = _entity(
+                    "bettingmarketgroup", identifier, name,
+                    bmg["description"], bmg)
+                self._add("bettingmarketgroup", sport_keys, [name], entity)
+
+    def _add(self, type, sport_keys, keys, entity):
+        table = self._entities[type]
+        for sport_key in (sport_keys or [None]):
+            for key in keys:
+                table.setdefault((sport_key, key), entity)
+
+    def get(self, type, identifier, sport=None):
+        """ The :class:`Entity` of ``type`` known as ``identifier`` (within
+            ``sport``), or ``None``
+        """
+        assert type in ENTITY_TYPES, "Unknown entity type {}".format(type)
+        return self._entities[type].get((sport, identifier))
+
+    def names(self, type, identifier, sport=None):
+        """ Localized names of an entity, language to name
+        """
+        entity = self.get(type, identifier, sport)
+        if entity is not None:
+            return entity.names
+
+    def aliases(self, type, identifier, sport=None):
+        """ Aliases of an entity
+        """
+        entity = self.get(type, identifier, sport)
+        if entity is not None:
+            return entity.aliases
+
+    def entities(self, type, sport=None):
+        """ All entities of ``type`` (within ``sport``)
+        """
+        seen = set()
+        for (sport_key, key), entity in self._entities[type].items():
+            if sport is not None and sport_key != sport:
+                continue
+            if id(entity) not in seen:
+                seen.add(id(entity))
+                yield entity
@@ -1,7 +1,13 @@
 from . import BookieSports, datestring
 import logging
-from pytz import timezone
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
 from . import log
+from .cache import LRUCache
+from .index import AliasIndex
+from . import canonical
+from . import validate
 
 class NotNormalizableException(Exception):
     pass
@@ -19,6 +25,134 @@ class ParicipantNotNormalizableException(NotNormalizableException):
     pass
 
 
+#: Fields of an incident's ``id`` that are replaced by their identifiers
+NORMALIZED_FIELDS = ("sport", "event_group_name", "home", "away")
+
+
+class NormalizedId(Mapping):
+    """ Read-only view of an incident's ``id`` with the normalized
+        identifiers in place of the provider's names
+
+        :param dict id: the ``id`` of the original incident, not modified
+        :param tuple identifiers: sport, event group, home and away
+            identifiers
+    """
+
+    __slots__ = ["_id", "_identifiers"]
+
+    def __init__(self, id, identifiers):
+        self._id = id
+        self._identifiers = identifiers
+
+    def __getitem__(self, key):
+        try:
+            return self._identifiers[NORMALIZED_FIELDS.index(key)]
+        except ValueError:
+            return self._id[key]
+
+    def __iter__(self):
+        return iter(self._id)
+
+    def __len__(self):
+        return len(self._id)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def to_dict(self):
+        """ The normalized ``id`` as a new plain dict
+        """
+        id = dict(self._id)
+        id.update(zip(NORMALIZED_FIELDS, self._identifiers))
+        return id
+
+
+class NormalizedIncident(Mapping):
+    """ Read-only view of a normalized incident
+
+        All keys but ``id`` are those of the original incident, which is
+        neither copied nor modified. ``id`` is a :class:`NormalizedId`.
+        Use :meth:`to_dict` where a plain (e.g. mutable or JSON serializable)
+        dict is needed.
+
+        :param dict incident: the original incident
+        :param tuple identifiers: sport, event group, home and away
+            identifiers
+    """
+
+    __slots__ = ["_incident", "id"]
+
+    def __init__(self, incident, identifiers):
+        self._incident = incident
+        self.id = NormalizedId(incident["id"], identifiers)
+
+    def __getitem__(self, key):
+        if key == "id":
+            return self.id
+        return self._incident[key]
+
+    def __iter__(self):
+        return iter(self._incident)
+
+    def __len__(self):
+        return len(self._incident)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def to_dict(self):
+        """ The normalized incident as a new dict, with a new ``id`` dict
+
+            All other values are shared with the original incident.
+        """
+        incident = dict(self._incident)
+        incident["id"] = self.id.to_dict()
+        return incident
+
+
+class NotFound(object):
+    """ Bounded, thread-safe record of the names that could not be
+        normalized
+
+        Every key is appended to ``filename`` (if given) the first time it
+        is recorded. Once ``maxsize`` keys are recorded the oldest are
+        forgotten, so they may be written again later.
+
+        :param str filename: file to append new keys to
+        :param int maxsize: maximum number of keys remembered
+    """
+
+    def __init__(self, filename=None, maxsize=65536):
+        self.filename = filename
+        self.maxsize = maxsize
+        self._keys = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key):
+        """ Record ``key``, returns ``True`` if it was not known yet
+        """
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys[key] = None
+            while len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+            if self.filename is not None:
+                with open(self.filename, "a", encoding="utf-8") as file:
+                    file.write(key + "\n")
+            return True
+
+    def keys(self):
+        with self._lock:
+            return list(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+
 class IncidentsNormalizer(object):
     """
         This class serves as the normalization entry point for incidents.
@@ -26,25 +160,134 @@ class IncidentsNormalizer(object):
         counterpart stored in the bookiesports package.
     """
 
-    NOT_FOUND = {}
+    NOT_FOUND_FILE = None
     """
-        As class variable to have one stream for missing normalization entries
+        default file normalization errors are written to, used by
+        normalizers created without ``not_found_file``
     """
 
-    NOT_FOUND_FILE = None
+    NOT_FOUND_SIZE = 65536
     """
-        If normalization errors should be written to file, set file here
+        default number of missing names remembered per normalizer
     """
 
     DEFAULT_CHAIN = "beatrice"
     """
-        default chosen chain for bookiesports
+        default chosen chain for bookiesports, used by normalizers created
+        without ``chain``
+    """
+
+    CACHE_SIZE = 4096
+    """
+        default number of resolved (sport, event group, home, away, start
+        time) tuples kept per normalizer, ``0`` disables the cache
     """
 
-    def __init__(self, chain=None):
+    def __init__(
+        self,
+        chain=None,
+        cache_size=None,
+        canonicalizer=None,
+        not_found_file=None,
+        not_found_size=None,
+    ):
+        """
+        All state is kept per normalizer, so normalizers of different chains
+        and with different ``not_found_file`` can be used side by side, and
+        one normalizer can be shared by several threads.
+
+        :param str chain: chain to normalize for, defaults to
+            :attr:`DEFAULT_CHAIN`
+        :param int cache_size: number of cached results, defaults to
+            :attr:`CACHE_SIZE`
+        :param bookiesports.canonical.Canonicalizer canonicalizer: turns
+            names into keys
+        :param str not_found_file: file missing names are appended to,
+            defaults to :attr:`NOT_FOUND_FILE`
+        :param int not_found_size: number of missing names remembered,
+            defaults to :attr:`NOT_FOUND_SIZE`
+        """
         if chain is None:
             chain = IncidentsNormalizer.DEFAULT_CHAIN
-        self._bookiesports = BookieSports(chain)
+        if cache_size is None:
+            cache_size = IncidentsNormalizer.CACHE_SIZE
+        if not_found_file is None:
+            not_found_file = IncidentsNormalizer.NOT_FOUND_FILE
+        if not_found_size is None:
+            not_found_size = IncidentsNormalizer.NOT_FOUND_SIZE
+        self._canonicalizer = canonicalizer or canonical.DEFAULT
+        self._cache = LRUCache(cache_size)
+        self._reload_lock = threading.Lock()
+        self.missing = NotFound(not_found_file, not_found_size)
+        self._load(BookieSports(chain))
+
+    def _load(self, bookiesports):
+        # The chain and its index are replaced together, lookups take both
+        # at once so that they never mix an index with another chain
+        self._loaded = (bookiesports, bookiesports.alias_index(
+            self._canonicalizer))
+        self._cache.clear()
+
+    def reload(self):
+        """ Pick up the chain as currently stored in
+            :attr:`BookieSports.CHAIN_CACHE` and drop all cached results
+        """
+        with self._reload_lock:
+            self._load(BookieSports(self.bookiesports.chain))
+
+    def _current(self):
+        """ The chain and its index, reloaded first if the chain in
+            :attr:`BookieSports.CHAIN_CACHE` was replaced
+        """
+        loaded = self._loaded
+        chain = loaded[0].chain
+        if BookieSports.CHAIN_CACHE.get(chain) is loaded[0]._data:
+            return loaded
+        with self._reload_lock:
+            # another thread may have reloaded while we waited for the lock
+            if BookieSports.CHAIN_CACHE.get(chain) is not self._loaded[0]._data:
+                self._load(BookieSports(chain))
+            return self._loaded
+
+    def cache_info(self):
+        """ Hits, misses, maximum and current size of the result cache
+
+            :rtype: bookiesports.cache.CacheInfo
+        """
+        return self._cache.info()
+
+    @property
+    def bookiesports(self):
+        """ The chain normalized for, as of the last (re)load
+        """
+        return self._loaded[0]
+
+    def refresh(self):
+        """ Reload if the chain in :attr:`BookieSports.CHAIN_CACHE` was
+            replaced since it was loaded
+        """
+        self._current()
+
+    def find_sport(self, name):
+        """ Identifier of the sport known as ``name``, or ``None``
+        """
+        return self._find_sport(self._current()[1], name)
+
+    def find_eventgroup(self, sport_identifier, name, start_time):
+        """ Identifier of the event group known as ``name`` that runs at
+            ``start_time``, or ``None``
+        """
+        return self._find_eventgroup(
+            self._current()[1], sport_identifier, name, start_time)
+
+    def find_participant(self, sport_identifier, name):
+        """ Identifier of the participant known as ``name``, or ``None``
+        """
+        return self._find_participant(
+            self._current()[1], sport_identifier, name)
+
+    def _find_sport(self, index, sport_name_in_incident):
+        return index.sport(sport_name_in_incident)[self.bookiesports.chain]
 
     def _get_sport_identifier(self,
                               sport_name_in_incident,
@@ -56,66 +299,27 @@ class IncidentsNormalizer(object):
         :type sport_name_in_incident: str
         :returns the normalized sport name
         """
-        for key, sport in self._bookiesports.items():  # @UnusedVariable
-            if self._search_name_and_alias(sport_name_in_incident, sport):
-                return sport["identifier"]
+        identifier = self._find_sport(
+            self._loaded[1], sport_name_in_incident)
+        if identifier is not None:
+            return identifier
 
-        IncidentsNormalizer.not_found(
-            self._bookiesports.network_name + "/" + sport_name_in_incident
+        self.not_found(
+            self.bookiesports.network_name + "/" + sport_name_in_incident
         )
         if errorIfNotFound:
             raise SportNotNormalizableException()
         return sport_name_in_incident
 
-    def _search_name_and_alias(self,
-                               search_for,
-                               search_container):
-        if search_container.get("aliases") and self._search_in(
-                search_for,
-                search_container["aliases"]):
-            return True
-        if self._search_in(search_for, search_container["name"].values()):
-            return True
-        if search_container.get("identifier", "").strip().lower() == search_for.strip().lower():
-            return True
-        return False
-
-    def _string_to_date(self, date_string, from_or_to):
-        if type(date_string) == str:
-            if len(date_string) == len("YYYY/YY/YY"):
-                date_string = date_string[0:4] + "-" + date_string[5:7] + "-" + date_string[8:10] + "T"
-                if from_or_to == "from":
-                    date_string = date_string + "00:00:00Z"
-                else:
-                    date_string = date_string + "23:59:59Z"
-            elif len(date_string) == len("YYYY/YY/YY XX:XX:XX"):
-                date_string = date_string[0:4] + "-" + date_string[5:7] + "-" + date_string[8:10] + "T" + date_string[11:19] + "Z"
-
-        if type(date_string).__name__ == "datetime":
-            return date_string
-        else:
-            return datestring.string_to_date(date_string)
-
-    def _start_time_within(self, eventgroup, start_date):
-        if eventgroup.get("finish_date", None) is None and eventgroup.get("start_date", None) is None:
-            return True
-
-        start_date = datestring.string_to_date(start_date)
-
-        try:
-            toReturn = start_date <= self._string_to_date(eventgroup["finish_date"], "to") and start_date >= self._string_to_date(eventgroup["start_date"], "from")
-        except TypeError:
-            # log.warning("datetime offset naive, failed")
-            pass
-
-        try:
-            _timezone = timezone('UTC')
-            start_date = _timezone.localize(start_date)
-            toReturn = start_date <= self._string_to_date(eventgroup["finish_date"], "to") and start_date >= self._string_to_date(eventgroup["start_date"], "from")
-        except TypeError:
-            # log.warning("datetime offset aware, failed")
-            pass
-        return toReturn
+    def _find_eventgroup(self,
+                         index,
+                         sport_identifier,
+                         event_group_name_in_incident,
+                         event_start_time_in_incident):
+        return index.eventgroup(
+            sport_identifier,
+            event_group_name_in_incident,
+            event_start_time_in_incident)[self.bookiesports.chain]
 
     def _get_eventgroup_identifier(self,
                                    sport_identifier,
@@ -131,21 +335,28 @@ class IncidentsNormalizer(object):
         :type event_group_name_in_incident: str
         :returns the normalized eventgroup name
         """
-        for key, sport in self._bookiesports.items():  # @UnusedVariable
-            if sport["identifier"] == sport_identifier:
-                for keyt, valuet in sport["eventgroups"].items():  # @UnusedVariable @IgnorePep8
-                    if self._search_name_and_alias(
-                            event_group_name_in_incident,
-                            valuet) and\
-                            self._start_time_within(valuet, event_start_time_in_incident):
-                        return valuet["identifier"]
-
-        IncidentsNormalizer.not_found(
-            self._bookiesports.network_name + "/" + sport_identifier + "/" + event_group_name_in_incident)
+        identifier = self._find_eventgroup(
+            self._loaded[1],
+            sport_identifier,
+            event_group_name_in_incident,
+            event_start_time_in_incident)
+        if identifier is not None:
+            return identifier
+
+        self.not_found(
+            self.bookiesports.network_name + "/" + sport_identifier + "/" + event_group_name_in_incident)
         if errorIfNotFound:
             raise EventGroupNotNormalizableException()
         return event_group_name_in_incident
 
+    def _find_participant(self,
+                          index,
+                          sport_identifier,
+                          participant_name_in_incident):
+        return index.participant(
+            sport_identifier,
+            participant_name_in_incident)[self.bookiesports.chain]
+
     def _get_participant_identifier(self,
                                     sport_identifier,
                                     event_group_identifier,
@@ -162,65 +373,317 @@ class IncidentsNormalizer(object):
         :type participant_name_in_incident: str
         :returns the participant eventgroup name
         """
-        for key, sport in self._bookiesports.items():  # @UnusedVariable
-            if sport["identifier"] == sport_identifier:
-                for teamsfile, participants in sport["participants"].items():  # @UnusedVariable @IgnorePep8
-                    for participant in participants["participants"]:
-                        if self._search_name_and_alias(
-                                participant_name_in_incident,
-                                participant):
-                            try:
-                                return participant["identifier"]
-                            except KeyError:
-                                return participant["name"]["en"]
-        IncidentsNormalizer.not_found(
-            self._bookiesports.network_name + "/" + sport_identifier + "/" + event_group_identifier + "/" + participant_name_in_incident)
+        identifier = self._find_participant(
+            self._loaded[1],
+            sport_identifier,
+            participant_name_in_incident)
+        if identifier is not None:
+            return identifier
+        self.not_found(
+            self.bookiesports.network_name + "/" + sport_identifier + "/" + event_group_identifier + "/" + participant_name_in_incident)
         if errorIfNotFound:
             raise ParicipantNotNormalizableException()
         return participant_name_in_incident
 
-    def normalize(self, incident, errorIfNotFound=False):
-        normalized_incident = incident.copy()
-        sport_identifier = self._get_sport_identifier(
+    def _resolve(self, loaded, sport, event_group_name, home, away,
+                 start_time):
+        """
+        Resolves the identifiers of one incident.
+
+        Misses are not raised but returned, so that they can be cached like
+        hits.
+
+        :param tuple loaded: the chain and its index to resolve with
+        :returns tuple of the four identifiers and a tuple of
+            ``(exception class, not found key, id field)`` for every miss
+        """
+        bookiesports, index = loaded
+        misses = []
+        prefix = bookiesports.network_name + "/"
+
+        sport_identifier = self._find_sport(index, sport)
+        if sport_identifier is None:
+            sport_identifier = sport
+            misses.append(
+                (SportNotNormalizableException, prefix + sport, "sport"))
+        prefix += sport_identifier + "/"
+
+        event_group_identifier = self._find_eventgroup(
+            index, sport_identifier, event_group_name, start_time)
+        if event_group_identifier is None:
+            event_group_identifier = event_group_name
+            misses.append((EventGroupNotNormalizableException,
+                           prefix + event_group_name, "event_group_name"))
+        prefix += event_group_identifier + "/"
+
+        identifiers = [sport_identifier, event_group_identifier]
+        for field, participant in [("home", home), ("away", away)]:
+            participant_identifier = self._find_participant(
+                index, sport_identifier, participant)
+            if participant_identifier is None:
+                participant_identifier = participant
+                misses.append((ParicipantNotNormalizableException,
+                               prefix + participant, field))
+            identifiers.append(participant_identifier)
+
+        return tuple(identifiers), tuple(misses)
+
+    def _lookup(self, incident):
+        """
+        The cached result of :meth:`_resolve` for an incident.
+
+        Cached results are tagged with the chain they were resolved with, so
+        that a result resolved while another thread reloads is never used
+        for the reloaded chain.
+        """
+        loaded = self._current()
+
+        key = (
             incident["id"]["sport"],
-            errorIfNotFound=errorIfNotFound)
-        event_group_identifier = self._get_eventgroup_identifier(
-            sport_identifier,
             incident["id"]["event_group_name"],
-            incident["id"]["start_time"],
-            errorIfNotFound=errorIfNotFound)
-        home_identifier = self._get_participant_identifier(
-            sport_identifier,
-            event_group_identifier,
             incident["id"]["home"],
-            errorIfNotFound=errorIfNotFound)
-        away_identifier = self._get_participant_identifier(
-            sport_identifier,
-            event_group_identifier,
             incident["id"]["away"],
-            errorIfNotFound=errorIfNotFound)
+            incident["id"]["start_time"],
+        )
+        cached = self._cache.get(key)
+        if cached is not LRUCache.MISSING and cached[0] is loaded[0]:
+            return cached[1]
+        result = self._resolve(loaded, *key)
+        self._cache.put(key, (loaded[0], result))
+        for exception, not_found_key, field in result[1]:
+            self.not_found(not_found_key)
+        return result
 
-        normalized_incident["id"]["sport"] = sport_identifier
-        normalized_incident["id"]["event_group_name"] = event_group_identifier
-        normalized_incident["id"]["home"] = home_identifier
-        normalized_incident["id"]["away"] = away_identifier
+    def normalize(self, incident, errorIfNotFound=False):
+        """
+        Normalize an incident.
 
-        return normalized_incident
+        :returns :class:`NormalizedIncident`, a read-only view of
+            ``incident``, which is not modified
+        """
+        identifiers, misses = self._lookup(incident)
+        if errorIfNotFound and misses:
+            raise misses[0][0]()
+
+        return NormalizedIncident(incident, identifiers)
+
+    def normalize_many(self, incidents, errorIfNotFound=False,
+                       validator=None):
+        """
+        Validate a batch of incidents, then normalize the valid ones.
 
-    def _search_in(self, search_for, in_list):
-        return search_for.strip().lower() in [x.strip().lower() for x in in_list]
+        Malformed incidents are rejected by the validator before any lookup
+        is made. With ``errorIfNotFound``, incidents with names that cannot
+        be normalized are rejected as well instead of raising.
+
+        :param bookiesports.validate.IncidentValidator validator: defaults
+            to :data:`bookiesports.validate.DEFAULT`
+        :returns tuple of a list with the :class:`NormalizedIncident` of
+            every incident (``None`` where rejected) and a list of
+            :class:`bookiesports.validate.IncidentError`
+        """
+        validator = validator or validate.DEFAULT
+        normalized = []
+        errors = []
+        for index, incident in enumerate(incidents):
+            problems = validator.errors(incident, index)
+            if not problems:
+                identifiers, misses = self._lookup(incident)
+                if errorIfNotFound:
+                    problems = [
+                        validate.IncidentError(
+                            index, ("id", field),
+                            "{!r} could not be normalized".format(
+                                incident["id"][field]))
+                        for exception, not_found_key, field in misses
+                    ]
+            if problems:
+                normalized.append(None)
+                errors.extend(problems)
+            else:
+                normalized.append(NormalizedIncident(incident, identifiers))
+        return normalized, errors
 
     @staticmethod
     def use_chain(chain, not_found_file=None):
+        """
+        Set the defaults of normalizers created afterwards.
+
+        Kept for compatibility, pass ``chain`` and ``not_found_file`` to the
+        normalizer instead. Normalizers that already exist are not affected.
+        """
         IncidentsNormalizer.DEFAULT_CHAIN = chain
         IncidentsNormalizer.NOT_FOUND_FILE = not_found_file
 
         logging.getLogger(__name__).debug("Incidents normalizer set for chain " + chain + ", using " + str(not_found_file) + " for missing entries")
 
-    @staticmethod
-    def not_found(key):
-        if IncidentsNormalizer.NOT_FOUND_FILE is not None and IncidentsNormalizer.NOT_FOUND.get(key, None) is None:
-            with open(IncidentsNormalizer.NOT_FOUND_FILE, "a", encoding="utf-8") as file:
-                file.write(key + "\n")
+    def not_found(self, key):
+        self.missing.add(key)
+
+
+class MultiChainNormalizer(object):
+    """
+        Normalizes incidents for several chains at once.
+
+        All chains share one :class:`bookiesports.index.AliasIndex`, in which
+        sports, event groups and participants that are identical across
+        chains are stored only once. Each name of an incident is looked up
+        once for all chains.
+
+        .. code-block:: python
+
+            normalizer = MultiChainNormalizer(["alice", "beatrice"])
+            normalizer.normalize(incident)
+            # {'alice': {...}, 'beatrice': {...}}
+    """
+
+    def __init__(
+        self,
+        chains,
+        cache_size=None,
+        canonicalizer=None,
+        not_found_file=None,
+        not_found_size=None,
+    ):
+        if cache_size is None:
+            cache_size = IncidentsNormalizer.CACHE_SIZE
+        if not_found_file is None:
+            not_found_file = IncidentsNormalizer.NOT_FOUND_FILE
+        if not_found_size is None:
+            not_found_size = IncidentsNormalizer.NOT_FOUND_SIZE
+        self.chains = [chain.lower() for chain in chains]
+        self._canonicalizer = canonicalizer or canonical.DEFAULT
+        self._cache = LRUCache(cache_size)
+        self._reload_lock = threading.Lock()
+        self.missing = NotFound(not_found_file, not_found_size)
+        self.reload()
+
+    def reload(self):
+        """ Rebuild the shared index from the chains as currently stored in
+            :attr:`BookieSports.CHAIN_CACHE` and drop all cached results
+        """
+        with self._reload_lock:
+            self._load()
+
+    def _load(self):
+        index = AliasIndex(self._canonicalizer)
+        chain_data = []
+        for chain in self.chains:
+            bookiesports = BookieSports(chain)
+            index.add(bookiesports)
+            chain_data.append(bookiesports._data)
+        # The index and the chains it was built from are replaced together
+        self._loaded = (index, tuple(chain_data))
+        self._cache.clear()
+
+    def _reloaded(self, chain_data):
+        return any(
+            BookieSports.CHAIN_CACHE.get(chain) is not data
+            for chain, data in zip(self.chains, chain_data)
+        )
+
+    def _current(self):
+        """ The index and the chains it was built from, rebuilt first if any
+            chain in :attr:`BookieSports.CHAIN_CACHE` was replaced
+        """
+        loaded = self._loaded
+        if not self._reloaded(loaded[1]):
+            return loaded
+        with self._reload_lock:
+            # another thread may have reloaded while we waited for the lock
+            if self._reloaded(self._loaded[1]):
+                self._load()
+            return self._loaded
+
+    @property
+    def index(self):
+        """ The shared :class:`bookiesports.index.AliasIndex`
+        """
+        return self._loaded[0]
+
+    def cache_info(self):
+        """ Hits, misses, maximum and current size of the result cache
+
+            :rtype: bookiesports.cache.CacheInfo
+        """
+        return self._cache.info()
+
+    def _resolve(self, index, sport, event_group_name, home, away,
+                 start_time):
+        """
+        Resolves the identifiers of one incident for all chains.
+
+        :param bookiesports.index.AliasIndex index: index to resolve with
+        :returns dict of chain to the tuple of the four identifiers and a
+            tuple of ``(exception class, not found key)`` for every miss
+        """
+        results = dict()
+        sports = index.sport(sport, self.chains)
+        for sport_identifier in set(sports.values()):
+            chains = [c for c in self.chains if sports[c] == sport_identifier]
+            if sport_identifier is None:
+                sport_identifier = sport
+            eventgroups = index.eventgroup(
+                sport_identifier, event_group_name, start_time, chains)
+            homes = index.participant(sport_identifier, home, chains)
+            aways = index.participant(sport_identifier, away, chains)
+            for chain in chains:
+                misses = []
+                prefix = chain + "/"
+                if sports[chain] is None:
+                    misses.append((SportNotNormalizableException,
+                                   prefix + sport, "sport"))
+                prefix += sport_identifier + "/"
+
+                event_group_identifier = eventgroups[chain]
+                if event_group_identifier is None:
+                    event_group_identifier = event_group_name
+                    misses.append((EventGroupNotNormalizableException,
+                                   prefix + event_group_name,
+                                   "event_group_name"))
+                prefix += event_group_identifier + "/"
+
+                identifiers = [sport_identifier, event_group_identifier]
+                for field, name, found in [("home", home, homes[chain]),
+                                           ("away", away, aways[chain])]:
+                    if found is None:
+                        found = name
+                        misses.append((ParicipantNotNormalizableException,
+                                       prefix + name, field))
+                    identifiers.append(found)
+                results[chain] = (tuple(identifiers), tuple(misses))
+        return results
 
-        IncidentsNormalizer.NOT_FOUND[key] = ""
+    def normalize(self, incident, errorIfNotFound=False):
+        """
+        Normalize an incident for all chains.
+
+        :returns dict of chain to the :class:`NormalizedIncident`
+        """
+        index, chain_data = self._current()
+
+        key = (
+            incident["id"]["sport"],
+            incident["id"]["event_group_name"],
+            incident["id"]["home"],
+            incident["id"]["away"],
+            incident["id"]["start_time"],
+        )
+        cached = self._cache.get(key)
+        if cached is not LRUCache.MISSING and cached[0] is chain_data:
+            results = cached[1]
+        else:
+            # tagged with the chains it was resolved from, see _current
+            results = self._resolve(index, *key)
+            self._cache.put(key, (chain_data, results))
+            for chain in self.chains:
+                for exception, not_found_key, field in results[chain][1]:
+                    self.missing.add(not_found_key)
+
+        normalized = dict()
+        for chain in self.chains:
+            identifiers, misses = results[chain]
+            if errorIfNotFound and misses:
+                raise misses[0][0]()
+            normalized[chain] = NormalizedIncident(incident, identifiers)
+        return normalized
@@ -0,0 +1,123 @@
+from types import MappingProxyType
+from collections import namedtuple
+
+#: A rule and how betting markets graded by it are resolved
+Rule = namedtuple(
+    "Rule", ["name", "identifier", "names", "description", "grading"])
+
+#: A betting market group with its rule resolved. ``dynamic`` is ``False``
+#: for static groups and ``True``, ``"hc"`` (handicap) or ``"ou"``
+#: (over/under) for dynamic ones, ``bettingmarkets`` holds
+#: the description of each betting market and ``templates`` their compiled
+#: :class:`bookiesports.render.I18nTemplate`
+BettingMarketGroup = namedtuple("BettingMarketGroup", [
+    "name",
+    "description",
+    "asset",
+    "dynamic",
+    "number_betting_markets",
+    "is_live",
+    "rule",
+    "bettingmarkets",
+    "templates",
+])
+
+#: Everything needed to create the markets of an event of an event group.
+#: ``static`` and ``dynamic`` split ``bettingmarketgroups`` by whether they
+#: depend on a handicap or over/under line, ``assets`` lists every asset
+#: used by any of them
+MarketPlan = namedtuple("MarketPlan", [
+    "sport",
+    "eventgroup",
+    "eventscheme",
+    "bettingmarketgroups",
+    "static",
+    "dynamic",
+    "assets",
+])
+
+
+def freeze(value):
+    """ Read-only copy of nested dicts and lists
+    """
+    if isinstance(value, dict):
+        return MappingProxyType(dict(
+            (key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class MarketPlans(object):
+    """ The market plan of every event group of a chain, resolved once
+
+        Betting market groups and rules that several event groups share are
+        resolved once and shared by their plans. Event groups are found by
+        their identifier or folder name, sports by their identifier or
+        folder name.
+
+        .. code-block:: python
+
+            plan = BookieSports("alice").market_plan(
+                "Ice Hockey", "NHL Regular Season")
+            [bmg.name for bmg in plan.dynamic]
+            # ['NHL_HCP_1', 'NHL_OU_1']
+
+        :param BookieSports bookiesports: the loaded chain
+    """
+
+    def __init__(self, bookiesports):
+        renderer = bookiesports.renderer
+        self._plans = dict()
+
+        for sportname, sport in bookiesports.items():
+            identifier = sport["identifier"]
+            rules = dict(
+                (name, Rule(
+                    name,
+                    rule["identifier"],
+                    freeze(rule.get("name", {})),
+                    freeze(rule.get("description", {})),
+                    freeze(rule["grading"])))
+                for name, rule in sport["rules"].items())
+
+            bmgs = dict()
+            for name, bmg in sport["bettingmarketgroups"].items():
+                bmgs[name] = BettingMarketGroup(
+                    name,
+                    freeze(bmg["description"]),
+                    tuple(bmg["asset"]),
+                    bmg["dynamic"],
+                    bmg["number_betting_markets"],
+                    bmg["is_live"],
+                    rules[bmg["rules"]],
+                    tuple(
+                        freeze(market.get("description", {}))
+                        for market in bmg["bettingmarkets"]),
+                    renderer.bettingmarkets(sportname, name))
+
+            for name, eventgroup in sport["eventgroups"].items():
+                groups = tuple(
+                    bmgs[bmg] for bmg in eventgroup["bettingmarketgroups"])
+                assets = []
+                for bmg in groups:
+                    for asset in bmg.asset:
+                        if asset not in assets:
+                            assets.append(asset)
+                plan = MarketPlan(
+                    identifier,
+                    eventgroup["identifier"],
+                    renderer.eventscheme(sportname, name),
+                    groups,
+                    tuple(bmg for bmg in groups if not bmg.dynamic),
+                    tuple(bmg for bmg in groups if bmg.dynamic),
+                    tuple(assets))
+                for sport_key in (sportname, identifier):
+                    for eventgroup_key in (name, eventgroup["identifier"]):
+                        self._plans.setdefault(
+                            (sport_key, eventgroup_key), plan)
+
+    def get(self, sport, eventgroup):
+        """ The :class:`MarketPlan` of an event group, or ``None``
+        """
+        return self._plans.get((sport, eventgroup))
@@ -0,0 +1,191 @@
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import threading
+from collections import Counter
+from . import BookieSports
+from .normalize import IncidentsNormalizer
+
+#: Profilers :func:`profile_chain` can run under
+PROFILERS = ["cprofile", "sample"]
+
+
+def read_incidents(filename):
+    """ Read incidents from a file holding either a JSON list or one JSON
+        incident per line
+    """
+    with open(filename, encoding="utf-8") as fid:
+        content = fid.read()
+    if content.lstrip().startswith("["):
+        return json.loads(content)
+    return [json.loads(line) for line in content.splitlines() if line.strip()]
+
+
+def _label(filename, lineno, function):
+    return "{} ({}:{})".format(function, os.path.basename(filename), lineno)
+
+
+class Sampler(object):
+    """ Sampling profiler that records the stack of the thread that started
+        it every ``interval`` seconds
+
+        :param float interval: seconds between two samples
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        #: stacks, root first, and how often they were sampled
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self, target):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(_label(
+                    code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(threading.get_ident(),))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def hot(self):
+        """ Functions by samples spent in the function itself
+
+            :returns: list of ``(function, samples, self seconds,
+                cumulative seconds)``
+        """
+        own = Counter()
+        cumulative = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for function in set(stack):
+                cumulative[function] += count
+        return [
+            (function, count, count * self.interval,
+             cumulative[function] * self.interval)
+            for function, count in own.most_common()
+        ]
+
+
+class Report(object):
+    """ Outcome of :func:`profile_chain`
+
+        :ivar list phases: ``(phase, wall seconds)`` in the order they ran
+        :ivar list hot: ``(function, calls or samples, self seconds,
+            cumulative seconds)``, hottest first
+        :ivar collections.Counter stacks: sampled stacks, only with the
+            sampling profiler
+    """
+
+    def __init__(self, profiler, phases, hot, stacks=None):
+        self.profiler = profiler
+        self.phases = phases
+        self.hot = hot
+        self.stacks = stacks
+
+    def collapsed(self):
+        """ Sampled stacks in the collapsed format read by flamegraph tools,
+            one ``frame;frame;frame count`` line per stack
+        """
+        if self.stacks is None:
+            raise ValueError(
+                "Collapsed stacks need the sampling profiler")
+        return "".join(
+            "{} {}\n".format(";".join(stack), count)
+            for stack, count in sorted(self.stacks.items()))
+
+    def format(self, top=20):
+        """ Phase wall times and the ``top`` hottest functions as text
+        """
+        lines = ["{:<12} {:>10}".format("phase", "wall [s]")]
+        for phase, seconds in self.phases:
+            lines.append("{:<12} {:>10.4f}".format(phase, seconds))
+        lines.append("")
+        lines.append("{:>10} {:>10} {:>10}  {}".format(
+            "calls" if self.profiler == "cprofile" else "samples",
+            "self [s]", "cum [s]", "function"))
+        for function, calls, own, cumulative in self.hot[:top]:
+            lines.append("{:>10} {:>10.4f} {:>10.4f}  {}".format(
+                calls, own, cumulative, function))
+        return "\n".join(lines)
+
+
+def profile_chain(
+    chain,
+    sports_folder=None,
+    incidents=None,
+    profiler="cprofile",
+    interval=0.001,
+):
+    """ Load ``chain`` from scratch and normalize ``incidents`` under a
+        profiler
+
+        The phases timed are ``load`` (reading and validating the chain),
+        ``index`` (building the normalizer's alias index) and ``normalize``
+        (replaying the incidents).
+
+        :param str chain: name of the chain
+        :param str sports_folder: where to load the chain from
+        :param list incidents: incidents to normalize
+        :param str profiler: ``cprofile`` for deterministic profiling of
+            every call, ``sample`` for a sampling profiler that also records
+            stacks
+        :param float interval: seconds between samples of ``sample``
+        :rtype: Report
+    """
+    assert profiler in PROFILERS, "Unknown profiler {}".format(profiler)
+    if profiler == "cprofile":
+        active = cProfile.Profile()
+        active.enable()
+    else:
+        active = Sampler(interval)
+        active.start()
+
+    phases = []
+    try:
+        start = time.perf_counter()
+        BookieSports(chain, sports_folder=sports_folder, override_cache=True)
+        phases.append(("load", time.perf_counter() - start))
+
+        start = time.perf_counter()
+        normalizer = IncidentsNormalizer(chain)
+        phases.append(("index", time.perf_counter() - start))
+
+        if incidents:
+            start = time.perf_counter()
+            for incident in incidents:
+                normalizer.normalize(incident)
+            phases.append(("normalize", time.perf_counter() - start))
+    finally:
+        if profiler == "cprofile":
+            active.disable()
+        else:
+            active.stop()
+
+    if profiler == "sample":
+        return Report(profiler, phases, active.hot(), active.stacks)
+
+    stats = pstats.Stats(active).stats
+    hot = sorted(
+        ((_label(*function), calls, own, cumulative)
+         for function, (primitive, calls, own, cumulative, callers)
+         in stats.items()),
+        key=lambda row: row[2], reverse=True)
+    return Report(profiler, phases, hot)
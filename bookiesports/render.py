@@ -0,0 +1,238 @@
+from string import Formatter
+from .cache import LRUCache
+from .exceptions import TemplateError
+
+#: Placeholders that may be used in event names and betting market
+#: descriptions
+VARIABLES = frozenset([
+    "teams.home",
+    "teams.away",
+    "handicap",
+    "handicaps.home",
+    "handicaps.away",
+    "overunder.value",
+])
+
+_formatter = Formatter()
+
+
+def variables(home=None, away=None, handicaps=None, handicap=None,
+              overunder=None):
+    """ Build the values to render a template with
+
+        :param str home: name of the home team
+        :param str away: name of the away team
+        :param tuple handicaps: handicaps of the home and away team
+        :param handicap: the handicap line
+        :param overunder: the over/under line
+    """
+    values = dict()
+    if home is not None:
+        values["teams.home"] = home
+    if away is not None:
+        values["teams.away"] = away
+    if handicaps is not None:
+        values["handicaps.home"], values["handicaps.away"] = handicaps
+    if handicap is not None:
+        values["handicap"] = handicap
+    if overunder is not None:
+        values["overunder.value"] = overunder
+    return values
+
+
+class Template(object):
+    """ A format string, parsed once and checked against the known
+        placeholders
+
+        :param str source: the format string, e.g. ``{teams.home} v {teams.away}``
+        :param set known: placeholders that may be used
+    """
+
+    __slots__ = ["source", "fields", "_parts"]
+
+    def __init__(self, source, known=VARIABLES):
+        self.source = source
+        parts = []
+        fields = []
+        try:
+            parsed = list(_formatter.parse(source))
+        except ValueError as exc:
+            raise TemplateError("Invalid template {!r}: {}".format(source, exc))
+        for literal, field, spec, conversion in parsed:
+            if field is not None:
+                if field not in known:
+                    raise TemplateError(
+                        "Unknown placeholder {{{}}} in {!r}".format(
+                            field, source))
+                if spec and "{" in spec:
+                    raise TemplateError(
+                        "Nested placeholders are not supported in {!r}".format(
+                            source))
+                fields.append(field)
+            parts.append((literal, field, spec, conversion))
+        self.fields = frozenset(fields)
+        self._parts = tuple(parts)
+
+    def render(self, values):
+        """ Render with ``values``, a dict as returned by :func:`variables`
+        """
+        out = []
+        for literal, field, spec, conversion in self._parts:
+            out.append(literal)
+            if field is None:
+                continue
+            try:
+                value = values[field]
+            except KeyError:
+                raise TemplateError(
+                    "No value for {{{}}} in {!r}".format(field, self.source))
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            out.append(format(value, spec or ""))
+        return "".join(out)
+
+
+class I18nTemplate(object):
+    """ An internationalized template, one :class:`Template` per language
+
+        :param dict sources: language to format string
+    """
+
+    __slots__ = ["templates", "fields"]
+
+    def __init__(self, sources, known=VARIABLES):
+        self.templates = tuple(
+            (language, Template(source, known))
+            for language, source in sources.items()
+            if isinstance(source, str)
+        )
+        self.fields = frozenset().union(
+            *[t.fields for _, t in self.templates])
+
+    def render(self, values):
+        """ Render all languages, returns a dict of language to text
+        """
+        return {
+            language: template.render(values)
+            for language, template in self.templates
+        }
+
+
+class Renderer(object):
+    """ Pre-compiled event names and betting market descriptions of a chain
+
+        All ``eventscheme`` names of the event groups and all ``description``
+        of the betting markets are compiled and checked once. Rendering
+        returns every language of a template and repeated renders are served
+        from a cache.
+
+        Event groups are found by their identifier or folder name, betting
+        market groups by their name.
+
+        .. code-block:: python
+
+            renderer = BookieSports("alice").renderer
+            renderer.event_names(
+                "Ice Hockey", "NHL Regular Season",
+                [("Boston Bruins", "Buffalo Sabres")])
+            # [{'en': 'Buffalo Sabres @ Boston Bruins'}]
+
+        :param BookieSports bookiesports: the loaded chain
+        :param int cache_size: number of rendered texts to keep
+    """
+
+    def __init__(self, bookiesports, cache_size=4096):
+        self._eventschemes = dict()
+        self._bettingmarkets = dict()
+        self._cache = LRUCache(cache_size)
+
+        for sportname, sport in bookiesports.items():
+            sport_keys = set([sportname, sport["identifier"]])
+            for eventgroupname, eventgroup in sport["eventgroups"].items():
+                scheme = eventgroup.get("eventscheme", {}).get("name", {})
+                template = self._compile(
+                    scheme, sportname + "/" + eventgroupname)
+                for sport_key in sport_keys:
+                    for eventgroup_key in [eventgroupname,
+                                           eventgroup["identifier"]]:
+                        self._eventschemes.setdefault(
+                            (sport_key, eventgroup_key), template)
+
+            for bmgname, bmg in sport["bettingmarketgroups"].items():
+                templates = tuple(
+                    self._compile(
+                        market.get("description", {}),
+                        sportname + "/" + bmgname)
+                    for market in bmg["bettingmarkets"]
+                )
+                for sport_key in sport_keys:
+                    self._bettingmarkets[(sport_key, bmgname)] = templates
+
+    @staticmethod
+    def _compile(sources, where):
+        try:
+            return I18nTemplate(sources)
+        except TemplateError as exc:
+            raise TemplateError("{}: {}".format(where, exc))
+
+    def _render(self, template, values):
+        key = (id(template), tuple(sorted(values.items())))
+        rendered = self._cache.get(key)
+        if rendered is LRUCache.MISSING:
+            rendered = template.render(values)
+            self._cache.put(key, rendered)
+        return dict(rendered)
+
+    def eventscheme(self, sport, eventgroup):
+        """ The compiled event name template of an event group
+        """
+        try:
+            return self._eventschemes[(sport, eventgroup)]
+        except KeyError:
+            raise TemplateError(
+                "No event group {} in {}".format(eventgroup, sport))
+
+    def bettingmarkets(self, sport, bettingmarketgroup):
+        """ The compiled description templates of the betting markets of a
+            betting market group
+        """
+        try:
+            return self._bettingmarkets[(sport, bettingmarketgroup)]
+        except KeyError:
+            raise TemplateError(
+                "No betting market group {} in {}".format(
+                    bettingmarketgroup, sport))
+
+    def event_names(self, sport, eventgroup, teams):
+        """ Names of many events of an event group
+
+            :param list teams: ``(home, away)`` per event
+            :returns: list of dicts of language to name
+        """
+        template = self.eventscheme(sport, eventgroup)
+        return [
+            self._render(template, variables(home=home, away=away))
+            for home, away in teams
+        ]
+
+    def bettingmarket_descriptions(self, sport, bettingmarketgroup, lines):
+        """ Descriptions of the betting markets of a betting market group for
+            many events or handicap/over-under lines
+
+            :param list lines: values per line, as returned by
+                :func:`variables`
+            :returns: per line, a list with a dict of language to description
+                per betting market
+        """
+        templates = self.bettingmarkets(sport, bettingmarketgroup)
+        return [
+            [self._render(template, values) for template in templates]
+            for values in lines
+        ]
+
+    def cache_info(self):
+        """ Hits, misses, maximum and current size of the render cache
+
+            :rtype: bookiesports.cache.CacheInfo
+        """
+        return self._cache.info()
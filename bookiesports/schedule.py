@@ -0,0 +1,156 @@
+import time
+from bisect import bisect_left
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from .index import timestamp
+
+#: Period in which events of an event group may be created. ``opens`` is
+#: ``leadtime_Max`` days before the ``start_date`` of the event group,
+#: ``closes`` its ``finish_date``. Either is ``None`` if the event group
+#: does not define it.
+Window = namedtuple(
+    "Window", ["sport", "eventgroup", "opens", "closes", "leadtime"])
+
+#: A window opening (``kind == "open"``) or closing (``kind == "close"``)
+Transition = namedtuple("Transition", ["when", "kind", "window"])
+
+
+def _seconds(when):
+    """ UNIX timestamp of a datetime, date string or timestamp; ``None``
+        means now
+    """
+    if when is None:
+        return time.time()
+    if isinstance(when, (int, float)):
+        return float(when)
+    return timestamp(when)
+
+
+def _datetime(seconds):
+    if seconds is None:
+        return None
+    return datetime.fromtimestamp(seconds, timezone.utc)
+
+
+class Timeline(object):
+    """ Precomputed creation windows of all event groups of a chain
+
+        Which event groups are open at a time is answered from a segment tree
+        over the window boundaries, in time logarithmic in the number of
+        event groups plus the number of open windows.
+
+        .. code-block:: python
+
+            timeline = BookieSports("alice").timeline
+            timeline.open_at("2021-06-01T12:00:00Z")
+            for transition in timeline.upcoming(days=7):
+                print(transition.when, transition.kind, transition.window)
+
+        :param BookieSports bookiesports: the loaded chain
+    """
+
+    def __init__(self, bookiesports):
+        windows = []
+        for sport in bookiesports.values():
+            for eventgroup in sport["eventgroups"].values():
+                leadtime = eventgroup.get("leadtime_Max")
+                opens = timestamp(eventgroup.get("start_date"))
+                if opens is not None and leadtime:
+                    opens -= timedelta(days=leadtime).total_seconds()
+                closes = timestamp(eventgroup.get("finish_date"))
+                windows.append((opens, closes, Window(
+                    sport["identifier"], eventgroup["identifier"],
+                    _datetime(opens), _datetime(closes), leadtime)))
+        self.windows = tuple(w for _, _, w in windows)
+
+        transitions = []
+        for opens, closes, window in windows:
+            if opens is not None:
+                transitions.append((opens, 0, "open", window))
+            if closes is not None:
+                transitions.append((closes, 1, "close", window))
+        transitions.sort(key=lambda t: (t[0], t[1]))
+        self._transition_times = [t[0] for t in transitions]
+        self._transitions = [
+            Transition(_datetime(t[0]), t[2], t[3]) for t in transitions]
+
+        # Every boundary and every gap between two boundaries is a slot. A
+        # window spans a range of slots, which is stored in the O(log n)
+        # nodes of a segment tree that cover it exactly
+        self._points = sorted(set(self._transition_times))
+        self._size = 2 * len(self._points) + 1
+        self._nodes = dict()
+        last = self._size - 1
+        for position, (opens, closes, window) in enumerate(windows):
+            low = 0 if opens is None else self._slot(opens)
+            high = last if closes is None else self._slot(closes)
+            self._insert(low, high, (position, window))
+
+    def _slot(self, seconds):
+        i = bisect_left(self._points, seconds)
+        if i < len(self._points) and self._points[i] == seconds:
+            return 2 * i + 1
+        return 2 * i
+
+    def _insert(self, low, high, entry):
+        low += self._size
+        high += self._size + 1
+        while low < high:
+            if low & 1:
+                self._nodes.setdefault(low, []).append(entry)
+                low += 1
+            if high & 1:
+                high -= 1
+                self._nodes.setdefault(high, []).append(entry)
+            low >>= 1
+            high >>= 1
+
+    def open_at(self, when=None):
+        """ Windows open at ``when`` (a datetime, date string or UNIX
+            timestamp, defaults to now)
+        """
+        node = self._slot(_seconds(when)) + self._size
+        found = []
+        while node:
+            found.extend(self._nodes.get(node, ()))
+            node >>= 1
+        found.sort(key=lambda entry: entry[0])
+        return [window for position, window in found]
+
+    def transitions(self, since=None, until=None):
+        """ Iterate over openings and closings in ``[since, until)`` in order
+            of time. ``since`` defaults to now, ``until`` to no limit.
+        """
+        start = bisect_left(self._transition_times, _seconds(since))
+        if until is None:
+            end = len(self._transitions)
+        else:
+            end = bisect_left(self._transition_times, _seconds(until))
+        for i in range(start, end):
+            yield self._transitions[i]
+
+    def upcoming(self, days=1, since=None):
+        """ Openings and closings within the next ``days`` days
+        """
+        since = _seconds(since)
+        return self.transitions(
+            since, since + timedelta(days=days).total_seconds())
+
+    def opening(self, since=None, until=None):
+        """ Windows opening in ``[since, until)``
+        """
+        return [t.window for t in self.transitions(since, until)
+                if t.kind == "open"]
+
+    def closing(self, since=None, until=None):
+        """ Windows closing in ``[since, until)``
+        """
+        return [t.window for t in self.transitions(since, until)
+                if t.kind == "close"]
+
+    def next_transition(self, since=None):
+        """ The first opening or closing at or after ``since``, or ``None``
+        """
+        i = bisect_left(self._transition_times, _seconds(since))
+        if i < len(self._transitions):
+            return self._transitions[i]
@@ -0,0 +1,269 @@
+import json
+import hashlib
+import threading
+from socketserver import ThreadingMixIn
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs, unquote
+from . import BookieSports
+from .index import ENTITY_TYPES
+from .log import log
+from .normalize import IncidentsNormalizer
+from .validate import valid_start_time
+
+#: Largest request body accepted, in bytes
+MAX_BODY = 16 * 1024 * 1024
+
+_NAME_LOOKUPS = ("sport", "eventgroup", "participant")
+
+
+def content_digest(bookiesports):
+    """ Digest of the content of a loaded chain, changes whenever any of its
+        documents does
+    """
+    data = dict(bookiesports, index=bookiesports.index)
+    return hashlib.sha1(json.dumps(
+        data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class _Chain(object):
+    """ One chain held in memory by the server
+    """
+
+    def __init__(self, chain):
+        self.chain = chain
+        self.normalizer = IncidentsNormalizer(chain)
+
+    def current(self):
+        """ The loaded chain, reloaded first if the chain in
+            :attr:`BookieSports.CHAIN_CACHE` was replaced
+        """
+        self.normalizer.refresh()
+        return self.normalizer.bookiesports
+
+
+def _etag(bookiesports):
+    return '"{}"'.format(bookiesports._derived("digest", content_digest))
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """ Answers the requests of :class:`LookupServer`
+
+        ``GET /``
+            chains served and their versions
+        ``GET /<chain>/sport?name=``
+            identifier of a sport
+        ``GET /<chain>/eventgroup?sport=&name=&start_time=``
+            identifier of an event group
+        ``GET /<chain>/participant?sport=&name=``
+            identifier of a participant
+        ``GET /<chain>/<type>/<identifier>?sport=``
+            names, aliases and data of an entity
+        ``POST /<chain>/normalize``
+            validate and normalize a list of incidents, one ``incident`` or
+            list of ``errors`` per incident
+
+        Successful responses about a chain carry its version as ``ETag``,
+        ``GET`` requests with a matching ``If-None-Match`` are answered with
+        ``304``.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "bookiesports"
+
+    def log_message(self, format, *args):
+        log.debug("%s - " + format, self.address_string(), *args)
+
+    def _send(self, status, body=None, etag=None):
+        payload = b""
+        if body is not None:
+            payload = json.dumps(body, default=str).encode("utf-8")
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _chain(self, name):
+        try:
+            return self.server.chains[name]
+        except KeyError:
+            raise HTTPError(404, "Unknown chain {}".format(name))
+
+    def _route(self):
+        url = urlsplit(self.path)
+        parts = [unquote(p) for p in url.path.split("/") if p]
+        query = dict((k, v[-1]) for k, v in parse_qs(url.query).items())
+        return parts, query
+
+    def _handle(self, method):
+        self._body_read = False
+        try:
+            parts, query = self._route()
+            if not parts:
+                if method != "GET":
+                    raise HTTPError(405, "Method not allowed")
+                return self._send(200, dict(
+                    (name, _etag(chain.current()).strip('"'))
+                    for name, chain in self.server.chains.items()))
+
+            chain = self._chain(parts[0])
+            bookiesports = chain.current()
+            etag = _etag(bookiesports)
+            if method == "GET":
+                if self.headers.get("If-None-Match") == etag:
+                    return self._send(304, etag=etag)
+                body = self._lookup(chain, bookiesports, parts[1:], query)
+            elif parts[1:] == ["normalize"]:
+                body = self._normalize(chain, self._body())
+            else:
+                raise HTTPError(405, "Method not allowed")
+            self._send(200, body, etag)
+        except HTTPError as e:
+            if method != "GET" and not self._body_read:
+                # the body is still on the socket, the connection cannot be
+                # reused
+                self.close_connection = True
+            self._send(e.status, dict(error=str(e)))
+        except Exception as e:
+            log.exception(e)
+            self.close_connection = True
+            self._send(500, dict(error=type(e).__name__))
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            self.close_connection = True
+            raise HTTPError(413, "Request body too large")
+        data = self.rfile.read(length)
+        self._body_read = True
+        try:
+            return json.loads(data.decode("utf-8"))
+        except ValueError:
+            raise HTTPError(400, "Request body is not valid JSON")
+
+    def _argument(self, query, name):
+        try:
+            return query[name]
+        except KeyError:
+            raise HTTPError(400, "Missing parameter {}".format(name))
+
+    def _lookup(self, chain, bookiesports, parts, query):
+        normalizer = chain.normalizer
+        if len(parts) == 1 and parts[0] in _NAME_LOOKUPS:
+            name = self._argument(query, "name")
+            if parts[0] == "sport":
+                identifier = normalizer.find_sport(name)
+            elif parts[0] == "eventgroup":
+                start_time = self._argument(query, "start_time")
+                if not valid_start_time(start_time):
+                    raise HTTPError(
+                        400, "Invalid start_time {}".format(start_time))
+                identifier = normalizer.find_eventgroup(
+                    self._argument(query, "sport"), name, start_time)
+            else:
+                identifier = normalizer.find_participant(
+                    self._argument(query, "sport"), name)
+            if identifier is None:
+                raise HTTPError(404, "{} {} not found".format(parts[0], name))
+            return dict(identifier=identifier)
+
+        if len(parts) == 2 and parts[0] in ENTITY_TYPES:
+            entity = bookiesports.lookup(
+                parts[0], parts[1], query.get("sport"))
+            if entity is None:
+                raise HTTPError(
+                    404, "{} {} not found".format(parts[0], parts[1]))
+            return dict(
+                type=entity.type,
+                sport=entity.sport,
+                identifier=entity.identifier,
+                names=dict(entity.names),
+                aliases=list(entity.aliases),
+                data=entity.data)
+
+        raise HTTPError(404, "Unknown resource")
+
+    def _normalize(self, chain, incidents):
+        if not isinstance(incidents, list):
+            raise HTTPError(400, "Expected a list of incidents")
+        normalized, errors = chain.normalizer.normalize_many(
+            incidents, errorIfNotFound=True)
+        results = [
+            dict(incident=incident.to_dict()) if incident is not None
+            else dict(errors=[])
+            for incident in normalized
+        ]
+        for error in errors:
+            results[error.index]["errors"].append(
+                dict(path=list(error.path), message=error.message))
+        return results
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+
+class LookupServer(ThreadingMixIn, HTTPServer):
+    """ Serves lookups and normalization of one or more chains over HTTP
+
+        The chains and their indexes are loaded once, when the server is
+        created, and shared by all requests. Each connection is handled in
+        its own thread and kept alive between requests.
+
+        .. code-block:: python
+
+            server = LookupServer(("127.0.0.1", 8010), ["alice", "beatrice"])
+            server.serve_forever()
+
+        :param tuple address: host and port to listen on
+        :param list chains: names of the chains to serve
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, chains, handler=RequestHandler):
+        self.chains = dict()
+        for chain in chains:
+            served = _Chain(chain)
+            _etag(served.current())  # digest before the first request
+            self.chains[chain] = served
+        HTTPServer.__init__(self, address, handler)
+
+
+def serve(chains, host="127.0.0.1", port=8010):
+    """ Serve ``chains`` until interrupted
+    """
+    server = LookupServer((host, port), chains)
+    log.info("Serving {} on {}:{}".format(
+        ", ".join(chains), *server.server_address[:2]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def serve_in_thread(chains, host="127.0.0.1", port=0):
+    """ Start a server in a background thread
+
+        :returns: the server, stop it with ``server.shutdown()``
+    """
+    server = LookupServer((host, port), chains)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
@@ -0,0 +1,410 @@
+import os
+import json
+import sqlite3
+from datetime import datetime
+from urllib.request import pathname2url
+from . import datestring
+from .exceptions import SportsNotFoundError
+from .canonical import Canonicalizer, DEFAULT
+from .index import search_keys, timestamp
+from .normalize import (
+    SportNotNormalizableException,
+    EventGroupNotNormalizableException,
+    ParicipantNotNormalizableException
+)
+
+#: Version of the database layout, stored in the ``meta`` table
+FORMAT_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE sports (
+    rowid INTEGER PRIMARY KEY,
+    identifier TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    id TEXT,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE eventgroups (
+    rowid INTEGER PRIMARY KEY,
+    sport TEXT NOT NULL,
+    identifier TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    id TEXT,
+    name TEXT NOT NULL,
+    participants TEXT,
+    eventscheme TEXT,
+    start_date REAL,
+    finish_date REAL,
+    leadtime_max REAL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE participants (
+    rowid INTEGER PRIMARY KEY,
+    sport TEXT NOT NULL,
+    file TEXT NOT NULL,
+    identifier TEXT NOT NULL,
+    name TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE aliases (
+    type TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    key TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    source TEXT NOT NULL,
+    ref INTEGER NOT NULL
+);
+CREATE TABLE rules (
+    sport TEXT NOT NULL,
+    name TEXT NOT NULL,
+    identifier TEXT NOT NULL,
+    id TEXT,
+    i18n_name TEXT,
+    description TEXT,
+    grading TEXT NOT NULL
+);
+CREATE TABLE bettingmarketgroups (
+    sport TEXT NOT NULL,
+    name TEXT NOT NULL,
+    rules TEXT NOT NULL,
+    description TEXT NOT NULL,
+    asset TEXT NOT NULL,
+    dynamic TEXT NOT NULL,
+    is_live INTEGER NOT NULL,
+    number_betting_markets INTEGER NOT NULL
+);
+CREATE TABLE eventgroup_bettingmarketgroups (
+    sport TEXT NOT NULL,
+    eventgroup TEXT NOT NULL,
+    bettingmarketgroup TEXT NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE bettingmarkets (
+    sport TEXT NOT NULL,
+    bettingmarketgroup TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE INDEX aliases_lookup ON aliases (type, key, sport);
+CREATE INDEX aliases_ref ON aliases (type, ref);
+CREATE INDEX sports_identifier ON sports (identifier);
+CREATE INDEX eventgroups_identifier ON eventgroups (sport, identifier);
+CREATE INDEX eventgroups_dates ON eventgroups (start_date, finish_date);
+CREATE INDEX participants_identifier ON participants (sport, identifier);
+CREATE INDEX rules_identifier ON rules (sport, name);
+CREATE INDEX bettingmarketgroups_name ON bettingmarketgroups (sport, name);
+CREATE INDEX eventgroup_bettingmarketgroups_eventgroup
+    ON eventgroup_bettingmarketgroups (sport, eventgroup);
+CREATE INDEX bettingmarkets_bettingmarketgroup
+    ON bettingmarkets (sport, bettingmarketgroup);
+"""
+
+
+def _json(value):
+    return json.dumps(value, default=str, sort_keys=True)
+
+
+def export(bookiesports, filename, canonicalizer=None):
+    """ Write a loaded chain into a normalized and indexed SQLite file
+
+        An existing file at ``filename`` is replaced.
+
+        :param BookieSports bookiesports: the loaded chain
+        :param str filename: location of the SQLite file
+        :param bookiesports.canonical.Canonicalizer canonicalizer: turns
+            names into search keys, it is stored with the data so that
+            :class:`SqliteLookup` uses the same one
+    """
+    if os.path.exists(filename):
+        os.remove(filename)
+    db = sqlite3.connect(filename)
+    try:
+        db.executescript(SCHEMA)
+        with db:
+            _export_chain(db, bookiesports, canonicalizer or DEFAULT)
+    finally:
+        db.close()
+
+
+def _export_chain(db, bookiesports, canonicalizer):
+    db.executemany(
+        "INSERT INTO meta (key, value) VALUES (?, ?)",
+        [
+            ("format_version", str(FORMAT_VERSION)),
+            ("chain", bookiesports.chain),
+            ("chain_id", bookiesports.chain_id),
+            ("canonicalizer", _json(canonicalizer.config())),
+        ]
+    )
+
+    def aliases(type, sport, entity, ref):
+        db.executemany(
+            "INSERT INTO aliases (type, sport, key, alias, source, ref) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (type, sport, canonicalizer(alias), alias, source, ref)
+                for source, alias in search_keys(entity)
+            ]
+        )
+
+    for sport_position, (sportname, sport) in enumerate(bookiesports.items()):
+        sport_identifier = sport["identifier"]
+        ref = db.execute(
+            "INSERT INTO sports (identifier, folder, id, name, position) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (sport_identifier, sportname, sport.get("id"),
+             _json(sport["name"]), sport_position)
+        ).lastrowid
+        aliases("sport", sport_identifier, sport, ref)
+
+        for position, (folder, eventgroup) in enumerate(
+                sport["eventgroups"].items()):
+            ref = db.execute(
+                "INSERT INTO eventgroups (sport, identifier, folder, id, "
+                "name, participants, eventscheme, start_date, finish_date, "
+                "leadtime_max, position) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (sport_identifier, eventgroup["identifier"], folder,
+                 eventgroup.get("id"), _json(eventgroup["name"]),
+                 eventgroup.get("participants"),
+                 _json(eventgroup.get("eventscheme")),
+                 timestamp(eventgroup.get("start_date")),
+                 timestamp(eventgroup.get("finish_date")),
+                 eventgroup.get("leadtime_Max"), position)
+            ).lastrowid
+            aliases("eventgroup", sport_identifier, eventgroup, ref)
+            db.executemany(
+                "INSERT INTO eventgroup_bettingmarketgroups "
+                "(sport, eventgroup, bettingmarketgroup, position) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (sport_identifier, eventgroup["identifier"], bmg, i)
+                    for i, bmg in enumerate(eventgroup["bettingmarketgroups"])
+                ]
+            )
+
+        position = 0
+        for teamsfile, participants in sport["participants"].items():
+            for participant in participants["participants"]:
+                identifier = participant.get(
+                    "identifier", participant["name"]["en"])
+                ref = db.execute(
+                    "INSERT INTO participants (sport, file, identifier, name, "
+                    "position) VALUES (?, ?, ?, ?, ?)",
+                    (sport_identifier, teamsfile, identifier,
+                     _json(participant["name"]), position)
+                ).lastrowid
+                aliases("participant", sport_identifier, participant, ref)
+                position += 1
+
+        for rulename, rule in sport["rules"].items():
+            db.execute(
+                "INSERT INTO rules (sport, name, identifier, id, i18n_name, "
+                "description, grading) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (sport_identifier, rulename, rule["identifier"],
+                 rule.get("id"), _json(rule.get("name")),
+                 _json(rule.get("description")), _json(rule["grading"]))
+            )
+
+        for bmgname, bmg in sport["bettingmarketgroups"].items():
+            db.execute(
+                "INSERT INTO bettingmarketgroups (sport, name, rules, "
+                "description, asset, dynamic, is_live, "
+                "number_betting_markets) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (sport_identifier, bmgname, bmg["rules"],
+                 _json(bmg["description"]), _json(bmg["asset"]),
+                 _json(bmg["dynamic"]), bool(bmg["is_live"]),
+                 bmg["number_betting_markets"])
+            )
+            db.executemany(
+                "INSERT INTO bettingmarkets (sport, bettingmarketgroup, "
+                "position, description) VALUES (?, ?, ?, ?)",
+                [
+                    (sport_identifier, bmgname, i, _json(bm["description"]))
+                    for i, bm in enumerate(bmg["bettingmarkets"])
+                ]
+            )
+
+
+class SqliteLookup(object):
+    """ Read-only queries against a file written by :func:`export`
+
+        The lookups behave like the ones of
+        :class:`bookiesports.normalize.IncidentsNormalizer`, but only touch
+        the rows they need instead of loading the whole chain.
+
+        .. code-block:: python
+
+            from bookiesports.sqlite import SqliteLookup
+            lookup = SqliteLookup("alice.sqlite")
+            lookup.get_sport_identifier("Hockey")
+
+        :param str filename: location of the SQLite file
+    """
+
+    def __init__(self, filename):
+        if not os.path.isfile(filename):
+            raise SportsNotFoundError(
+                "No bookiesports database found in {}".format(filename))
+        self._db = sqlite3.connect(
+            "file:{}?mode=ro".format(pathname2url(os.path.abspath(filename))),
+            uri=True,
+            check_same_thread=False
+        )
+        self.meta = dict(self._db.execute("SELECT key, value FROM meta"))
+        assert int(self.meta["format_version"]) == FORMAT_VERSION, \
+            "Unsupported database format {}".format(
+                self.meta["format_version"])
+        self.canonicalizer = Canonicalizer(
+            **json.loads(self.meta["canonicalizer"]))
+
+    def close(self):
+        self._db.close()
+
+    @property
+    def chain(self):
+        return self.meta["chain"]
+
+    @property
+    def chain_id(self):
+        return self.meta["chain_id"]
+
+    def _one(self, query, args):
+        row = self._db.execute(query, args).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    def get_sport_identifier(self, name, errorIfNotFound=False):
+        """ Find the identifier of a sport by name, alias or identifier
+        """
+        identifier = self._one(
+            "SELECT s.identifier FROM aliases a "
+            "JOIN sports s ON s.rowid = a.ref "
+            "WHERE a.type = 'sport' AND a.key = ? "
+            "ORDER BY s.position LIMIT 1",
+            (self.canonicalizer(name),)
+        )
+        if identifier is not None:
+            return identifier
+        if errorIfNotFound:
+            raise SportNotNormalizableException()
+        return name
+
+    def get_eventgroup_identifier(self, sport_identifier, name, start_time,
+                                  errorIfNotFound=False):
+        """ Find the identifier of an event group that is known by ``name``
+            and runs at ``start_time``
+        """
+        when = timestamp(datestring.string_to_date(start_time))
+        identifier = self._one(
+            "SELECT e.identifier FROM aliases a "
+            "JOIN eventgroups e ON e.rowid = a.ref "
+            "WHERE a.type = 'eventgroup' AND a.key = ? AND a.sport = ? "
+            "AND (e.start_date IS NULL OR e.start_date <= ?) "
+            "AND (e.finish_date IS NULL OR e.finish_date >= ?) "
+            "ORDER BY e.position LIMIT 1",
+            (self.canonicalizer(name), sport_identifier, when, when)
+        )
+        if identifier is not None:
+            return identifier
+        if errorIfNotFound:
+            raise EventGroupNotNormalizableException()
+        return name
+
+    def get_participant_identifier(self, sport_identifier,
+                                   event_group_identifier, name,
+                                   errorIfNotFound=False):
+        """ Find the identifier of a participant of a sport
+        """
+        identifier = self._one(
+            "SELECT p.identifier FROM aliases a "
+            "JOIN participants p ON p.rowid = a.ref "
+            "WHERE a.type = 'participant' AND a.key = ? AND a.sport = ? "
+            "ORDER BY p.position LIMIT 1",
+            (self.canonicalizer(name), sport_identifier)
+        )
+        if identifier is not None:
+            return identifier
+        if errorIfNotFound:
+            raise ParicipantNotNormalizableException()
+        return name
+
+    def get_sport(self, identifier):
+        """ Return the stored fields of a sport (or ``None``)
+        """
+        row = self._db.execute(
+            "SELECT identifier, folder, id, name FROM sports "
+            "WHERE identifier = ?", (identifier,)).fetchone()
+        if row is None:
+            return None
+        return dict(
+            identifier=row[0], folder=row[1], id=row[2],
+            name=json.loads(row[3]))
+
+    def get_eventgroup(self, sport_identifier, identifier):
+        """ Return the stored fields of an event group (or ``None``)
+        """
+        row = self._db.execute(
+            "SELECT identifier, folder, id, name, participants, eventscheme, "
+            "start_date, finish_date, leadtime_max FROM eventgroups "
+            "WHERE sport = ? AND identifier = ? ORDER BY position LIMIT 1",
+            (sport_identifier, identifier)).fetchone()
+        if row is None:
+            return None
+        return dict(
+            identifier=row[0], folder=row[1], id=row[2],
+            name=json.loads(row[3]), participants=row[4],
+            eventscheme=json.loads(row[5]), start_date=row[6],
+            finish_date=row[7], leadtime_Max=row[8],
+            bettingmarketgroups=[
+                x[0] for x in self._db.execute(
+                    "SELECT bettingmarketgroup "
+                    "FROM eventgroup_bettingmarketgroups "
+                    "WHERE sport = ? AND eventgroup = ? ORDER BY position",
+                    (sport_identifier, identifier))
+            ])
+
+    def get_participant(self, sport_identifier, identifier):
+        """ Return a participant including its aliases (or ``None``)
+        """
+        row = self._db.execute(
+            "SELECT rowid, identifier, file, name FROM participants "
+            "WHERE sport = ? AND identifier = ? ORDER BY position LIMIT 1",
+            (sport_identifier, identifier)).fetchone()
+        if row is None:
+            return None
+        return dict(
+            identifier=row[1], file=row[2], name=json.loads(row[3]),
+            aliases=[
+                x[0] for x in self._db.execute(
+                    "SELECT alias FROM aliases "
+                    "WHERE type = 'participant' AND source = 'alias' "
+                    "AND ref = ? ORDER BY rowid", (row[0],))
+            ])
+
+    def eventgroups(self, sport_identifier=None, at=None):
+        """ List event group identifiers as ``(sport, identifier)``,
+            optionally restricted to a sport and to groups running at
+            ``at`` (a date string or datetime)
+        """
+        query = "SELECT sport, identifier FROM eventgroups WHERE 1"
+        args = []
+        if sport_identifier is not None:
+            query += " AND sport = ?"
+            args.append(sport_identifier)
+        if at is not None:
+            if not isinstance(at, datetime):
+                at = datestring.string_to_date(at)
+            when = timestamp(at)
+            query += (
+                " AND (start_date IS NULL OR start_date <= ?)"
+                " AND (finish_date IS NULL OR finish_date >= ?)")
+            args.extend([when, when])
+        query += " ORDER BY sport, position"
+        return [tuple(x) for x in self._db.execute(query, args)]
@@ -0,0 +1,211 @@
+import os
+import json
+import yaml
+import random
+from datetime import datetime, timedelta, timezone
+
+#: Dynamic flavours the generated betting market groups cycle through
+_DYNAMIC = [False, "hc", "ou"]
+
+_DESCRIPTIONS = {
+    False: ["{teams.home}", "{teams.away}"],
+    "hc": ["{teams.home} +/- {handicap}", "{teams.away} +/- {handicap}"],
+    "ou": ["Over {overunder.value}", "Under {overunder.value}"],
+}
+
+_METRICS = {
+    False: ("{result.home} - {result.away}",
+            [("{metric} > 0", "{metric} <= 0"),
+             ("{metric} < 0", "{metric} >= 0")]),
+    "hc": ("({result.home} - {handicaps.home}) - "
+           "({result.away} - {handicaps.away})",
+           [("{metric} > 0", "{metric} < 0"),
+            ("{metric} < 0", "{metric} > 0")]),
+    "ou": ("{result.total}",
+           [("{metric} > {overunder.value}", "{metric} <= {overunder.value}"),
+            ("{metric} <= {overunder.value}", "{metric} > {overunder.value}")]),
+}
+
+#: Start and finish of every generated event group
+START_DATE = datetime(2020, 1, 1, tzinfo=timezone.utc)
+FINISH_DATE = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def _dump(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fid:
+        yaml.safe_dump(data, fid, default_flow_style=False, allow_unicode=True)
+
+
+def _aliases(name, count):
+    return ["{} alias {}".format(name, i) for i in range(count)]
+
+
+def generate_chain(
+    sports_folder,
+    chain="synthetic",
+    sports=2,
+    eventgroups=5,
+    participants=20,
+    aliases=3,
+    rules=3,
+    bettingmarketgroups=3,
+):
+    """ Write a schema-valid chain of configurable size
+
+        Every event group gets its own participants file, so the chain holds
+        ``sports * eventgroups * participants`` participants in total. Each
+        sport has ``bettingmarketgroups`` betting market groups, all of
+        which are offered by each event group, and ``rules`` rules they are
+        graded by.
+
+        :param str sports_folder: folder to create the chain in
+        :param str chain: name of the chain (its folder)
+        :returns: the chain folder
+    """
+    chain_folder = os.path.join(sports_folder, chain)
+    _dump(os.path.join(chain_folder, "index.yaml"), dict(chain_id=chain))
+
+    rules = max(1, rules)
+    for s in range(sports):
+        sportname = "Sport{}".format(s)
+        sportDir = os.path.join(chain_folder, sportname)
+        eventgroupnames = [
+            "League{}".format(e) for e in range(eventgroups)]
+        _dump(os.path.join(sportDir, "index.yaml"), dict(
+            identifier=sportname,
+            name=dict(en=sportname),
+            aliases=_aliases(sportname, aliases),
+            id=None,
+            eventgroups=eventgroupnames
+        ))
+
+        rulenames = []
+        for r in range(rules):
+            dynamic = _DYNAMIC[r % len(_DYNAMIC)]
+            metric, resolutions = _METRICS[dynamic]
+            rulename = "R_{}_{}".format(sportname, r)
+            rulenames.append((rulename, dynamic))
+            _dump(os.path.join(sportDir, "rules", rulename + ".yaml"), dict(
+                identifier=rulename,
+                id=None,
+                name=dict(en=rulename),
+                description=dict(en="Rule {} of {}".format(r, sportname)),
+                grading=dict(
+                    metric=metric,
+                    resolutions=[
+                        dict(win=win, not_win=not_win, void="False")
+                        for win, not_win in resolutions
+                    ]
+                )
+            ))
+
+        bmgnames = []
+        for b in range(bettingmarketgroups):
+            rulename, dynamic = rulenames[b % len(rulenames)]
+            bmgname = "{}_BMG_{}".format(sportname, b)
+            bmgnames.append(bmgname)
+            _dump(os.path.join(
+                sportDir, "bettingmarketgroups", bmgname + ".yaml"), dict(
+                description=dict(
+                    display_name=bmgname, en=bmgname, sen=bmgname),
+                asset=["TEST", "BTF"],
+                dynamic=dynamic,
+                number_betting_markets=2,
+                is_live=True,
+                rules=rulename,
+                bettingmarkets=[
+                    dict(description=dict(en=description))
+                    for description in _DESCRIPTIONS[dynamic]
+                ]
+            ))
+
+        for e, eventgroupname in enumerate(eventgroupnames):
+            identifier = "{} {}".format(sportname, eventgroupname)
+            participantsfile = "{}_Teams".format(eventgroupname)
+            _dump(os.path.join(sportDir, eventgroupname, "index.yaml"), dict(
+                identifier=identifier,
+                name=dict(en=identifier, sen=eventgroupname),
+                aliases=_aliases(identifier, aliases),
+                id=None,
+                participants=participantsfile,
+                bettingmarketgroups=bmgnames,
+                eventscheme=dict(
+                    name=dict(en="{teams.home} v {teams.away}")),
+                leadtime_Max=14,
+                start_date=START_DATE,
+                finish_date=FINISH_DATE
+            ))
+
+            teams = []
+            for p in range(participants):
+                name = "{} Team {}".format(identifier, p)
+                teams.append(dict(
+                    identifier=name,
+                    name=dict(en=name),
+                    aliases=_aliases(name, aliases)
+                ))
+            _dump(os.path.join(
+                sportDir, "participants", participantsfile + ".yaml"),
+                dict(participants=teams))
+
+    return chain_folder
+
+
+def _spelling(rng, entity):
+    """ A random name under which an entity is known
+    """
+    names = list(entity.get("aliases") or []) + list(entity["name"].values())
+    return rng.choice(names)
+
+
+def generate_incidents(bookiesports, count=1000, miss_rate=0.0, seed=0):
+    """ Create incidents for the event groups and participants of a loaded
+        chain, spelled with random aliases
+
+        :param BookieSports bookiesports: the loaded chain
+        :param int count: number of incidents
+        :param float miss_rate: share of incidents with an unknown team
+        :param int seed: seed of the random generator
+        :returns: list of incidents
+    """
+    rng = random.Random(seed)
+    eventgroups = []
+    for sport in bookiesports.values():
+        for eventgroup in sport["eventgroups"].values():
+            teams = sport["participants"].get(
+                eventgroup["participants"], {}).get("participants", [])
+            if len(teams) >= 2:
+                eventgroups.append((sport, eventgroup, teams))
+    assert eventgroups, "No event group with at least two participants"
+
+    calls = ["create", "in_progress", "finish", "result"]
+    incidents = []
+    for i in range(count):
+        sport, eventgroup, teams = rng.choice(eventgroups)
+        home, away = rng.sample(teams, 2)
+        start = eventgroup.get("start_date") or START_DATE
+        start_time = start + timedelta(days=rng.randint(0, 365))
+        incident = {
+            "id": {
+                "sport": _spelling(rng, sport),
+                "event_group_name": _spelling(rng, eventgroup),
+                "start_time": start_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "home": _spelling(rng, home),
+                "away": _spelling(rng, away),
+            },
+            "call": calls[i % len(calls)],
+            "arguments": {},
+        }
+        if rng.random() < miss_rate:
+            incident["id"]["away"] = "Unknown Team {}".format(i)
+        incidents.append(incident)
+    return incidents
+
+
+def write_incidents(filename, incidents):
+    """ Store incidents as JSON lines
+    """
+    with open(filename, "w", encoding="utf-8") as fid:
+        for incident in incidents:
+            fid.write(json.dumps(incident) + "\n")
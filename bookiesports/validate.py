@@ -0,0 +1,115 @@
+import os
+import yaml
+import jsonschema
+from collections import namedtuple
+from .datestring import string_to_date
+from .exceptions import InvalidIncidentError
+
+#: The incident schema shipped with the package
+SCHEMA_FILE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "schema", "incident.yaml")
+
+#: Fields of an incident's ``id`` the normalizer looks up
+ID_FIELDS = ("sport", "event_group_name", "start_time", "home", "away")
+
+#: A problem with an incident. ``index`` is its position in a batch,
+#: ``path`` the keys leading to the offending value, e.g. ``("id", "home")``
+IncidentError = namedtuple("IncidentError", ["index", "path", "message"])
+
+
+def valid_start_time(value):
+    """ Whether ``value`` is a start time the normalizer understands, i.e.
+        an existing date in RFC 3339 or ``YYYYMMDD``
+    """
+    if not isinstance(value, str):
+        return False
+    try:
+        string_to_date(value)
+    except (ValueError, OverflowError):
+        return False
+    return True
+
+
+class IncidentValidator(object):
+    """ Checks incidents against the incident schema
+
+        The schema is loaded and its validator built once. Every incident is
+        first checked for the fields the normalizer needs, which is cheap
+        and rejects most malformed incidents. Only incidents that pass are
+        validated against the full schema.
+
+        .. code-block:: python
+
+            validator = IncidentValidator()
+            validator.errors({"id": {"sport": "Hockey"}, "call": "create"})
+            # [IncidentError(index=None, path=('id', 'event_group_name'),
+            #                message="'event_group_name' is missing"), ...]
+
+        :param dict schema: schema to validate against, defaults to the one
+            in :data:`SCHEMA_FILE`
+    """
+
+    def __init__(self, schema=None):
+        if schema is None:
+            with open(SCHEMA_FILE, encoding="utf-8") as fid:
+                schema = yaml.safe_load(fid)
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        self.schema = schema
+        self._validator = cls(schema)
+
+    def _fast_errors(self, incident, index):
+        if not isinstance(incident, dict):
+            return [IncidentError(index, (), "incident is not an object")]
+        id = incident.get("id")
+        if not isinstance(id, dict):
+            return [IncidentError(
+                index, ("id",),
+                "'id' is missing" if id is None else "'id' is not an object")]
+        errors = []
+        for field in ID_FIELDS:
+            value = id.get(field)
+            if value is None:
+                errors.append(IncidentError(
+                    index, ("id", field), "'{}' is missing".format(field)))
+            elif not isinstance(value, str) or not value:
+                errors.append(IncidentError(
+                    index, ("id", field),
+                    "'{}' is not a non-empty string".format(field)))
+        if not errors and not valid_start_time(id["start_time"]):
+            errors.append(IncidentError(
+                index, ("id", "start_time"),
+                "{!r} is not a valid date-time".format(id["start_time"])))
+        return errors
+
+    def errors(self, incident, index=None, full=True):
+        """ All problems with ``incident``, an empty list if it is valid
+
+            :param int index: position of the incident in a batch, copied to
+                the errors
+            :param bool full: validate against the full schema, not only
+                the fields needed for normalization
+            :rtype: list of :class:`IncidentError`
+        """
+        errors = self._fast_errors(incident, index)
+        if errors or not full:
+            return errors
+        return [
+            IncidentError(index, tuple(error.absolute_path), error.message)
+            for error in self._validator.iter_errors(incident)
+        ]
+
+    def is_valid(self, incident, full=True):
+        return not self.errors(incident, full=full)
+
+    def validate(self, incident, full=True):
+        """ Raise :class:`bookiesports.exceptions.InvalidIncidentError` if
+            ``incident`` is not valid
+        """
+        errors = self.errors(incident, full=full)
+        if errors:
+            raise InvalidIncidentError(errors)
+
+
+#: Used by the normalizers unless they are given a different one
+DEFAULT = IncidentValidator()
@@ -0,0 +1,56 @@
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from bookiesports import BookieSports
+from bookiesports.bundle import pack
+
+BASE_FOLDER = BookieSports.BASE_FOLDER
+
+
+class Testcases(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.expected = dict(BookieSports("alice", override_cache=True))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def tearDown(self):
+        BookieSports.BASE_FOLDER = BASE_FOLDER
+        BookieSports.CHAIN_CACHE.clear()
+
+    def assertLoads(self, sports_folder):
+        self.assertIn("alice", BookieSports.list_chains())
+        alice = BookieSports(
+            "alice", sports_folder=sports_folder, override_cache=True)
+        self.assertEqual(dict(alice), self.expected)
+        self.assertEqual(
+            alice.chain_id,
+            "6b6b5f0ce7a36d323768e534f3edb41c6d6332a541a95725b98e28d140850134")
+
+    def test_zip(self):
+        filename = os.path.join(self.tmpdir, "sports.zip")
+        with zipfile.ZipFile(filename, "w") as archive:
+            for root, dirs, files in os.walk(os.path.join(BASE_FOLDER, "alice")):
+                for f in files:
+                    path = os.path.join(root, f)
+                    archive.write(path, os.path.relpath(path, BASE_FOLDER))
+        self.assertLoads(filename)
+
+    def test_tar(self):
+        filename = os.path.join(self.tmpdir, "sports.tar.gz")
+        with tarfile.open(filename, "w:gz") as archive:
+            archive.add(BASE_FOLDER, arcname="bookiesports")
+        self.assertLoads(filename)
+
+    def test_bundle(self):
+        filename = os.path.join(self.tmpdir, "sports.bundle")
+        self.assertGreater(pack(BASE_FOLDER, filename, ["alice"]), 0)
+        self.assertLoads(filename)
+        self.assertEqual(BookieSports.list_chains(), ["alice"])
@@ -0,0 +1,85 @@
+import unittest
+from bookiesports.dedup import IncidentDeduplicator, event_key
+from bookiesports.normalize import IncidentsNormalizer
+
+
+def incident(home="BOS", away="Buffalo Sabres", call="create",
+             start_time="2021-06-01T12:00:00Z", provider="a"):
+    return {
+        "id": {
+            "sport": "Hockey",
+            "event_group_name": "NHL",
+            "start_time": start_time,
+            "home": home,
+            "away": away,
+        },
+        "call": call,
+        "arguments": {},
+        "provider_info": {"name": provider},
+    }
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class Testcases(unittest.TestCase):
+
+    def setUp(self):
+        self.normalizer = IncidentsNormalizer("alice")
+        self.clock = Clock()
+
+    def test_event_key(self):
+        a = self.normalizer.normalize(incident())
+        b = self.normalizer.normalize(incident(
+            home="Boston Bruins", away="BUF",
+            start_time="2021-06-01T12:00:00+00:00"))
+        self.assertEqual(event_key(a), event_key(b))
+        self.assertEqual(len(event_key(a)), 16)
+        c = self.normalizer.normalize(incident(
+            start_time="2021-06-02T12:00:00Z"))
+        self.assertNotEqual(event_key(a), event_key(c))
+
+    def test_drop(self):
+        dedup = IncidentDeduplicator(
+            self.normalizer, window=60, clock=self.clock)
+        self.assertIsNotNone(dedup.process(incident()))
+        self.assertIsNone(dedup.process(incident(home="Boston Bruins")))
+        # another call of the same event is no copy
+        self.assertIsNotNone(dedup.process(incident(call="in_progress")))
+
+        self.clock.now = 60
+        self.assertIsNotNone(dedup.process(incident()))
+        info = dedup.info()
+        self.assertEqual(info.passed, 3)
+        self.assertEqual(info.dropped, 1)
+        self.assertEqual(info.expired, 2)
+        self.assertEqual(info.currsize, 1)
+
+    def test_size(self):
+        dedup = IncidentDeduplicator(
+            self.normalizer, max_size=1, clock=self.clock)
+        dedup.process(incident())
+        dedup.process(incident(call="in_progress"))
+        self.assertEqual(len(dedup), 1)
+        self.assertIsNotNone(dedup.process(incident()))
+
+    def test_merge(self):
+        providers = dict()
+
+        def merge(first, copy):
+            providers.setdefault(
+                event_key(first), [first["provider_info"]["name"]]).append(
+                copy["provider_info"]["name"])
+
+        dedup = IncidentDeduplicator(
+            self.normalizer, merge=merge, clock=self.clock)
+        first = dedup.process(incident(provider="a"))
+        self.assertIsNone(dedup.process(incident(away="BUF", provider="b")))
+        self.assertEqual(providers[event_key(first)], ["a", "b"])
+        self.assertEqual(dedup.info().merged, 1)
+        self.assertEqual(dedup.info().dropped, 0)
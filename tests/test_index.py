@@ -0,0 +1,56 @@
+import unittest
+from bookiesports import BookieSports
+
+
+class Testcases(unittest.TestCase):
+
+    def setUp(self):
+        self.bookiesports = BookieSports("alice")
+
+    def test_reverse_lookup(self):
+        entity = self.bookiesports.lookup(
+            "participant", "Boston Bruins", sport="Ice Hockey")
+        self.assertEqual(entity.type, "participant")
+        self.assertEqual(entity.sport, "Ice Hockey")
+        self.assertEqual(entity.names["sen"], "BOS")
+        self.assertIn("BOS", entity.aliases)
+
+        sport = self.bookiesports.lookup("sport", "Ice Hockey")
+        self.assertIs(sport.data, self.bookiesports["Ice Hockey"])
+        self.assertEqual(sport.names["en"], "Ice Hockey")
+
+        # found by identifier as well as by folder name
+        eventgroup = self.bookiesports.lookup(
+            "eventgroup", "NHL Regular Season", sport="Ice Hockey")
+        self.assertIs(eventgroup, self.bookiesports.lookup(
+            "eventgroup", "NHL#RegSeas", sport="Ice Hockey"))
+
+        bmg = self.bookiesports.lookup(
+            "bettingmarketgroup", "NHL_ML_1", sport="Ice Hockey")
+        self.assertEqual(bmg.names["en"], "Moneyline")
+        self.assertIsNotNone(self.bookiesports.lookup(
+            "rule", "R_NHL_ML_1", sport="Ice Hockey"))
+
+        self.assertIsNone(self.bookiesports.lookup(
+            "participant", "Unknown", sport="Ice Hockey"))
+
+    def test_reverse_entities(self):
+        index = self.bookiesports.reverse_index
+        self.assertEqual(
+            len(list(index.entities("sport"))), len(self.bookiesports))
+        teams = sum(
+            len(participants["participants"])
+            for participants in
+            self.bookiesports["Ice Hockey"]["participants"].values())
+        self.assertEqual(
+            len(list(index.entities("participant", sport="Ice Hockey"))),
+            teams)
+
+    def test_reverse_reload(self):
+        index = self.bookiesports.reverse_index
+        self.assertIs(index, BookieSports("alice").reverse_index)
+        reloaded = BookieSports("alice", override_cache=True)
+        self.assertIsNot(index, reloaded.reverse_index)
+        self.assertIs(
+            reloaded.lookup("sport", "Ice Hockey").data,
+            reloaded["Ice Hockey"])
@@ -0,0 +1,145 @@
+import copy
+import unittest
+from bookiesports import BookieSports, canonical
+from bookiesports.index import AliasIndex
+from bookiesports.normalize import (
+    IncidentsNormalizer,
+    MultiChainNormalizer,
+    ParicipantNotNormalizableException
+)
+
+
+def incident(home="BOS", away="Buffalo Sabres", sport="Hockey",
+             event_group_name="NHL", start_time="2021-06-01T12:00:00Z"):
+    return {
+        "id": {
+            "sport": sport,
+            "event_group_name": event_group_name,
+            "start_time": start_time,
+            "home": home,
+            "away": away
+        },
+        "call": "create",
+        "arguments": {"season": "2021"}
+    }
+
+
+class Testcases(unittest.TestCase):
+
+    def test_normalize(self):
+        normalizer = IncidentsNormalizer("alice")
+        normalized = normalizer.normalize(incident())
+        self.assertEqual(normalized["id"], {
+            "sport": "Ice Hockey",
+            "event_group_name": "NHL Regular Season",
+            "start_time": "2021-06-01T12:00:00Z",
+            "home": "Boston Bruins",
+            "away": "Buffalo Sabres"
+        })
+        self.assertEqual(normalized["call"], "create")
+
+    def test_normalize_input_unchanged(self):
+        normalizer = IncidentsNormalizer("alice")
+        original = incident()
+        expected = copy.deepcopy(original)
+        normalized = normalizer.normalize(original)
+        self.assertEqual(original, expected)
+        self.assertEqual(normalized["id"]["home"], "Boston Bruins")
+        self.assertIs(normalized["arguments"], original["arguments"])
+        with self.assertRaises(TypeError):
+            normalized["id"]["home"] = "BOS"
+
+        plain = normalized.to_dict()
+        self.assertIsInstance(plain["id"], dict)
+        self.assertEqual(plain, normalized)
+        plain["id"]["home"] = "BOS"
+        self.assertEqual(normalized["id"]["home"], "Boston Bruins")
+
+    def test_cache(self):
+        normalizer = IncidentsNormalizer("alice", cache_size=2)
+        normalizer.normalize(incident())
+        normalizer.normalize(incident())
+        self.assertEqual(normalizer.cache_info()[:2], (1, 1))
+
+        normalizer.normalize(incident(home="Unknown"))
+        normalizer.normalize(incident(away="Unknown"))
+        self.assertEqual(normalizer.cache_info().currsize, 2)
+
+        # misses are cached too, and still raise
+        with self.assertRaises(ParicipantNotNormalizableException):
+            normalizer.normalize(incident(away="Unknown"), errorIfNotFound=True)
+        self.assertEqual(normalizer.cache_info().hits, 2)
+
+    def test_cache_reload(self):
+        normalizer = IncidentsNormalizer("alice")
+        normalizer.normalize(incident())
+        BookieSports("alice", override_cache=True)
+        normalizer.normalize(incident())
+        self.assertEqual(normalizer.cache_info()[:2], (0, 1))
+
+    def test_cache_disabled(self):
+        normalizer = IncidentsNormalizer("alice", cache_size=0)
+        normalizer.normalize(incident())
+        normalizer.normalize(incident())
+        self.assertEqual(normalizer.cache_info().currsize, 0)
+
+    def test_multichain(self):
+        chains = ["alice", "beatrice", "charlie"]
+        multi = MultiChainNormalizer(chains)
+        single = {chain: IncidentsNormalizer(chain, cache_size=0)
+                  for chain in chains}
+        incidents = [
+            incident(),
+            incident(home="Unknown"),
+            incident(sport="Curling"),
+            incident(start_time="2030-01-01T12:00:00Z"),
+            incident(sport="Soccer", event_group_name="Premier League",
+                     home="Gunners", away="Chelsea"),
+        ]
+        for i in incidents:
+            results = multi.normalize(i)
+            self.assertEqual(sorted(results), chains)
+            for chain in chains:
+                self.assertEqual(
+                    results[chain]["id"],
+                    single[chain].normalize(copy.deepcopy(i))["id"])
+
+        separate = 0
+        for chain in chains:
+            index = AliasIndex()
+            index.add(BookieSports(chain))
+            separate += len(index)
+        self.assertLess(len(multi.index), separate)
+
+    def test_canonical(self):
+        key = canonical.DEFAULT
+        self.assertEqual(key("Bayern München"), key("bayern munchen"))
+        self.assertEqual(
+            key("Brighton & Hove Albion"), key("Brighton and Hove Albion"))
+        self.assertEqual(key(" NHL-Regular  Season "), "nhl regular season")
+        self.assertEqual(key("Man Utd"), key("Man United"))
+        self.assertNotEqual(
+            canonical.SIMPLE("Bayern München"),
+            canonical.SIMPLE("Bayern Munchen"))
+
+        normalizer = IncidentsNormalizer("alice")
+        normalized = normalizer.normalize(incident(
+            home="boston  bruins!", away="Búffalo Sabres",
+            event_group_name="nhl-regular season"))
+        self.assertEqual(normalized["id"]["home"], "Boston Bruins")
+        self.assertEqual(normalized["id"]["away"], "Buffalo Sabres")
+        self.assertEqual(
+            normalized["id"]["event_group_name"], "NHL Regular Season")
+
+        simple = IncidentsNormalizer("alice", canonicalizer=canonical.SIMPLE)
+        normalized = simple.normalize(incident(away="Búffalo Sabres"))
+        self.assertEqual(normalized["id"]["away"], "Búffalo Sabres")
+
+        # equally configured canonicalizers share one index
+        bookiesports = BookieSports("alice")
+        self.assertIs(
+            bookiesports.alias_index(canonical.Canonicalizer()),
+            bookiesports.alias_index(canonical.DEFAULT))
+        self.assertIsNot(
+            bookiesports.alias_index(canonical.SIMPLE),
+            bookiesports.alias_index(canonical.DEFAULT))
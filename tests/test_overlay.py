@@ -0,0 +1,97 @@
+import os
+import yaml
+import shutil
+import tempfile
+import unittest
+from bookiesports import BookieSports
+from bookiesports.exceptions import SportsNotFoundError
+
+BASE_FOLDER = BookieSports.BASE_FOLDER
+
+
+def write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fid:
+        yaml.safe_dump(data, fid)
+
+
+class Testcases(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        shutil.copytree(
+            os.path.join(BASE_FOLDER, "alice"),
+            os.path.join(self.tmpdir, "alice"))
+        BookieSports.CHAIN_CACHE.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+        BookieSports.BASE_FOLDER = BASE_FOLDER
+        BookieSports.CHAIN_CACHE.clear()
+
+    def delta(self, path, data):
+        write(os.path.join(self.tmpdir, "delta", path), data)
+
+    def test_overlay(self):
+        self.delta("index.yaml", dict(
+            chain_id="delta", base="alice", remove=["Soccer/EPL", "Baseball"]))
+        self.delta("Ice Hockey/participants/NHL_Teams_2021-22.yaml", dict(
+            participants=[dict(identifier="Team", name=dict(en="Team"))]))
+        self.delta("Ice Hockey/NHL#RegSeas/index.yaml", dict(
+            identifier="NHL", name=dict(en="NHL"), id=None,
+            participants="NHL_Teams_2021-22",
+            bettingmarketgroups=["NHL_ML_1"],
+            eventscheme=dict(name=dict(en="{teams.home} v {teams.away}"))))
+
+        delta = BookieSports(
+            "delta", sports_folder=self.tmpdir, override_cache=True)
+        alice = BookieSports("alice")
+        self.assertEqual(delta.chain_id, "delta")
+
+        # the base is loaded once and shared
+        self.assertIs(delta["Basketball"], alice["Basketball"])
+        self.assertNotIn("Baseball", delta)
+        self.assertIn("EPL", alice["Soccer"]["eventgroups"])
+        self.assertNotIn("EPL", delta["Soccer"]["eventgroups"])
+
+        hockey = delta["Ice Hockey"]
+        self.assertEqual(
+            hockey["participants"]["NHL_Teams_2021-22"]["participants"][0][
+                "identifier"], "Team")
+        self.assertEqual(
+            hockey["eventgroups"]["NHL#RegSeas"]["identifier"], "NHL")
+        self.assertIs(hockey["rules"]["R_NHL_ML_1"],
+                      alice["Ice Hockey"]["rules"]["R_NHL_ML_1"])
+        self.assertNotEqual(
+            alice["Ice Hockey"]["eventgroups"]["NHL#RegSeas"]["identifier"],
+            "NHL")
+
+    def test_override_cache_reloads_base(self):
+        self.delta("index.yaml", dict(chain_id="delta", base="alice"))
+        BookieSports("delta", sports_folder=self.tmpdir)
+
+        path = os.path.join(
+            self.tmpdir, "alice", "Ice Hockey", "NHL#RegSeas", "index.yaml")
+        with open(path) as fid:
+            eventgroup = yaml.safe_load(fid)
+        eventgroup["identifier"] = "NHL"
+        write(path, eventgroup)
+
+        delta = BookieSports(
+            "delta", sports_folder=self.tmpdir, override_cache=True)
+        self.assertEqual(
+            delta["Ice Hockey"]["eventgroups"]["NHL#RegSeas"]["identifier"],
+            "NHL")
+
+    def test_invalid_remove(self):
+        self.delta("index.yaml", dict(
+            chain_id="delta", base="alice",
+            remove=["Ice Hockey/eventgroups/NHL#RegSeas"]))
+        with self.assertRaises(SportsNotFoundError):
+            BookieSports(
+                "delta", sports_folder=self.tmpdir, override_cache=True)
+
+    def test_circular(self):
+        self.delta("index.yaml", dict(chain_id="delta", base="delta"))
+        with self.assertRaises(SportsNotFoundError):
+            BookieSports("delta", sports_folder=self.tmpdir)
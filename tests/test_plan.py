@@ -0,0 +1,61 @@
+import unittest
+from bookiesports import BookieSports
+from bookiesports.render import variables
+
+
+class Testcases(unittest.TestCase):
+
+    def setUp(self):
+        self.bookiesports = BookieSports("alice")
+
+    def test_market_plan(self):
+        plan = self.bookiesports.market_plan("Ice Hockey", "NHL#RegSeas")
+        self.assertIs(plan, self.bookiesports.market_plan(
+            "Ice Hockey", "NHL Regular Season"))
+        eventgroup = self.bookiesports["Ice Hockey"]["eventgroups"][
+            "NHL#RegSeas"]
+        self.assertEqual(
+            [bmg.name for bmg in plan.bettingmarketgroups],
+            eventgroup["bettingmarketgroups"])
+        self.assertEqual(
+            len(plan.static) + len(plan.dynamic),
+            len(plan.bettingmarketgroups))
+        self.assertTrue(all(bmg.dynamic for bmg in plan.dynamic))
+        self.assertFalse(any(bmg.dynamic for bmg in plan.static))
+        self.assertEqual(plan.assets, ("TEST", "BTF"))
+
+        bmg = plan.bettingmarketgroups[0]
+        definition = self.bookiesports["Ice Hockey"][
+            "bettingmarketgroups"][bmg.name]
+        self.assertEqual(bmg.rule.name, definition["rules"])
+        self.assertEqual(
+            bmg.rule.grading["metric"],
+            self.bookiesports["Ice Hockey"]["rules"][definition["rules"]][
+                "grading"]["metric"])
+        self.assertEqual(len(bmg.templates), len(bmg.bettingmarkets))
+        self.assertEqual(
+            plan.eventscheme.render(variables(home="A", away="B")),
+            {"en": "B @ A"})
+
+        self.assertIsNone(self.bookiesports.market_plan("Ice Hockey", "x"))
+
+    def test_market_plan_immutable(self):
+        plan = self.bookiesports.market_plan("Soccer", "EPL")
+        bmg = plan.bettingmarketgroups[0]
+        with self.assertRaises(TypeError):
+            bmg.description["en"] = "changed"
+        with self.assertRaises(TypeError):
+            bmg.rule.grading["resolutions"][0]["win"] = "True"
+        with self.assertRaises(AttributeError):
+            plan.assets.append("BTC")
+
+    def test_market_plan_shared(self):
+        # betting market groups and rules are resolved once per sport
+        soccer = self.bookiesports["Soccer"]
+        plans = [
+            self.bookiesports.market_plan("Soccer", name)
+            for name in soccer["eventgroups"]]
+        groups = dict()
+        for plan in plans:
+            for bmg in plan.bettingmarketgroups:
+                self.assertIs(groups.setdefault(bmg.name, bmg), bmg)
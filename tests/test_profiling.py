@@ -0,0 +1,49 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from bookiesports import BookieSports
+from bookiesports.profiling import profile_chain, read_incidents
+from bookiesports.synthetic import generate_incidents, write_incidents
+
+
+class Testcases(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.incidents = generate_incidents(BookieSports("alice"), 200)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_read_incidents(self):
+        lines = os.path.join(self.tmpdir, "incidents.jsonl")
+        write_incidents(lines, self.incidents)
+        self.assertEqual(read_incidents(lines), self.incidents)
+
+        listed = os.path.join(self.tmpdir, "incidents.json")
+        with open(listed, "w") as fid:
+            json.dump(self.incidents, fid)
+        self.assertEqual(read_incidents(listed), self.incidents)
+
+    def test_cprofile(self):
+        report = profile_chain("alice", incidents=self.incidents)
+        self.assertEqual(
+            [phase for phase, seconds in report.phases],
+            ["load", "index", "normalize"])
+        functions = [row[0] for row in report.hot]
+        self.assertTrue(any(f.startswith("normalize (") for f in functions))
+        self.assertIn("normalize", report.format(5))
+        with self.assertRaises(ValueError):
+            report.collapsed()
+
+    def test_sample(self):
+        report = profile_chain(
+            "alice", incidents=self.incidents, profiler="sample",
+            interval=0.0005)
+        self.assertTrue(report.stacks)
+        for line in report.collapsed().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            self.assertGreater(int(count), 0)
+            self.assertTrue(stack)
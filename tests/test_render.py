@@ -0,0 +1,85 @@
+import os
+import yaml
+import shutil
+import tempfile
+import unittest
+from bookiesports import BookieSports
+from bookiesports.exceptions import TemplateError
+from bookiesports.render import Template, I18nTemplate, variables
+
+
+class Testcases(unittest.TestCase):
+
+    def test_template(self):
+        template = Template("{teams.home} +/- {handicap:.1f}")
+        self.assertEqual(template.fields, {"teams.home", "handicap"})
+        self.assertEqual(
+            template.render(variables(home="Boston Bruins", handicap=1.5)),
+            "Boston Bruins +/- 1.5")
+        self.assertEqual(Template("{{literal}}").render({}), "{literal}")
+
+    def test_invalid(self):
+        with self.assertRaises(TemplateError):
+            Template("{teams.hometeam} v {teams.away}")
+        with self.assertRaises(TemplateError):
+            Template("{teams.home")
+        with self.assertRaises(TemplateError):
+            Template("{teams.home}").render(variables(away="Buffalo Sabres"))
+
+    def test_i18n(self):
+        template = I18nTemplate({
+            "en": "{teams.home} v {teams.away}",
+            "sen": "{teams.home}-{teams.away}"})
+        self.assertEqual(
+            template.render(variables(home="BOS", away="BUF")),
+            {"en": "BOS v BUF", "sen": "BOS-BUF"})
+
+    def test_renderer(self):
+        renderer = BookieSports("alice").renderer
+        teams = [("Boston Bruins", "Buffalo Sabres")] * 3
+        self.assertEqual(
+            renderer.event_names("Ice Hockey", "NHL Regular Season", teams),
+            [{"en": "Buffalo Sabres @ Boston Bruins"}] * 3)
+        self.assertEqual(
+            renderer.event_names("Ice Hockey", "NHL#RegSeas", teams[:1]),
+            [{"en": "Buffalo Sabres @ Boston Bruins"}])
+        self.assertEqual(
+            renderer.bettingmarket_descriptions(
+                "Ice Hockey", "NHL_HCP_1", [
+                    variables("Boston Bruins", "Buffalo Sabres", handicap=1.5),
+                    variables("Boston Bruins", "Buffalo Sabres", handicap=2.5),
+                ]),
+            [
+                [{"en": "Boston Bruins +/- 1.5"}, {"en": "Buffalo Sabres +/- 1.5"}],
+                [{"en": "Boston Bruins +/- 2.5"}, {"en": "Buffalo Sabres +/- 2.5"}],
+            ])
+        self.assertGreater(renderer.cache_info().hits, 0)
+
+    def test_outdated_chain_keeps_renderer(self):
+        outdated = BookieSports("alice")
+        BookieSports("alice", override_cache=True)
+        # built once for the outdated chain, not shared with the reloaded one
+        self.assertIs(outdated.renderer, outdated.renderer)
+        self.assertIsNot(outdated.renderer, BookieSports("alice").renderer)
+
+    def test_broken_chain_not_cached(self):
+        from bookiesports.synthetic import generate_chain
+        base_folder = BookieSports.BASE_FOLDER
+        tmpdir = tempfile.mkdtemp()
+        try:
+            generate_chain(tmpdir, "broken", sports=1, eventgroups=1)
+            index = os.path.join(
+                tmpdir, "broken", "Sport0", "League0", "index.yaml")
+            with open(index) as fid:
+                eventgroup = yaml.safe_load(fid)
+            eventgroup["eventscheme"]["name"]["en"] = "{teams.hom}"
+            with open(index, "w") as fid:
+                yaml.safe_dump(eventgroup, fid)
+
+            for i in range(2):
+                with self.assertRaises(TemplateError):
+                    BookieSports("broken", sports_folder=tmpdir)
+            self.assertNotIn("broken", BookieSports.CHAIN_CACHE)
+        finally:
+            shutil.rmtree(tmpdir)
+            BookieSports.BASE_FOLDER = base_folder
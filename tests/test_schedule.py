@@ -0,0 +1,61 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from bookiesports import BookieSports
+
+
+class Testcases(unittest.TestCase):
+
+    def setUp(self):
+        self.timeline = BookieSports("alice").timeline
+
+    def open_at(self, when):
+        return set(
+            (w.sport, w.eventgroup) for w in self.timeline.open_at(when))
+
+    def test_open_at(self):
+        self.assertIn(
+            ("Ice Hockey", "NHL Regular Season"),
+            self.open_at("2021-06-01T12:00:00Z"))
+        # leadtime_Max of 14 days before the start_date
+        self.assertIn(
+            ("Ice Hockey", "NHL Regular Season"),
+            self.open_at("2019-12-20T00:00:00Z"))
+        self.assertNotIn(
+            ("Ice Hockey", "NHL Regular Season"),
+            self.open_at("2019-12-01T00:00:00Z"))
+        # finish_date is inclusive
+        self.assertIn(
+            ("Ice Hockey", "NHL Regular Season"),
+            self.open_at("2022-01-01T00:00:00Z"))
+        self.assertNotIn(
+            ("Ice Hockey", "NHL Regular Season"),
+            self.open_at("2022-01-01T00:00:01Z"))
+
+    def test_matches_scan(self):
+        start = datetime(2019, 12, 1, tzinfo=timezone.utc)
+        for day in range(0, 800, 7):
+            when = start + timedelta(days=day)
+            expected = set(
+                (w.sport, w.eventgroup) for w in self.timeline.windows
+                if w.opens is None or w.opens <= when
+                if w.closes is None or when <= w.closes)
+            self.assertEqual(self.open_at(when), expected)
+
+    def test_transitions(self):
+        transitions = list(self.timeline.transitions(
+            "2019-01-01T00:00:00Z", "2030-01-01T00:00:00Z"))
+        self.assertEqual(transitions, sorted(
+            transitions, key=lambda t: t.when))
+        self.assertIn("open", [t.kind for t in transitions])
+        self.assertIn("close", [t.kind for t in transitions])
+
+        upcoming = list(self.timeline.upcoming(
+            days=30, since="2019-12-10T00:00:00Z"))
+        self.assertIn(
+            ("Ice Hockey", "NHL Regular Season"),
+            [(t.window.sport, t.window.eventgroup) for t in upcoming])
+        self.assertEqual(
+            self.timeline.next_transition("2019-12-10T00:00:00Z"),
+            upcoming[0])
+        self.assertEqual(self.timeline.opening(
+            "2030-01-01T00:00:00Z", "2031-01-01T00:00:00Z"), [])
@@ -0,0 +1,131 @@
+import json
+import unittest
+from http.client import HTTPConnection
+from urllib.parse import quote
+from bookiesports import BookieSports
+from bookiesports.server import serve_in_thread
+
+
+class Testcases(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serve_in_thread(["alice"])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.connection = HTTPConnection(*self.server.server_address[:2])
+
+    def tearDown(self):
+        self.connection.close()
+
+    def request(self, method, path, body=None, headers={}):
+        if body is not None:
+            body = json.dumps(body)
+        self.connection.request(method, path, body, headers)
+        response = self.connection.getresponse()
+        data = response.read()
+        return response, json.loads(data.decode("utf-8")) if data else None
+
+    def test_lookups(self):
+        # all requests share one kept alive connection
+        response, body = self.request("GET", "/alice/sport?name=Hockey")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, dict(identifier="Ice Hockey"))
+        sock = self.connection.sock
+
+        response, body = self.request(
+            "GET", "/alice/participant?sport=Ice+Hockey&name=BOS")
+        self.assertEqual(body, dict(identifier="Boston Bruins"))
+        response, body = self.request(
+            "GET", "/alice/eventgroup?sport=Ice+Hockey&name=NHL"
+                   "&start_time=2021-06-01T12:00:00Z")
+        self.assertEqual(body, dict(identifier="NHL Regular Season"))
+        response, body = self.request(
+            "GET", "/alice/participant?sport=Ice+Hockey&name=Unknown")
+        self.assertEqual(response.status, 404)
+
+        response, body = self.request(
+            "GET", "/alice/eventgroup/{}?sport=Ice+Hockey".format(
+                quote("NHL#RegSeas")))
+        self.assertEqual(body["identifier"], "NHL Regular Season")
+        self.assertIs(self.connection.sock, sock)
+
+    def test_etag(self):
+        response, body = self.request("GET", "/")
+        version = '"{}"'.format(body["alice"])
+
+        response, body = self.request("GET", "/alice/sport?name=Hockey")
+        self.assertEqual(response.getheader("ETag"), version)
+        response, body = self.request(
+            "GET", "/alice/sport?name=Hockey",
+            headers={"If-None-Match": version})
+        self.assertEqual(response.status, 304)
+
+        # a reloaded chain with identical content keeps its version
+        BookieSports("alice", override_cache=True)
+        response, body = self.request("GET", "/alice/sport?name=Hockey")
+        self.assertEqual(response.getheader("ETag"), version)
+
+    def test_normalize(self):
+        incidents = [
+            {"id": {"sport": "Hockey", "event_group_name": "NHL",
+                    "start_time": "2021-06-01T12:00:00Z",
+                    "home": "BOS", "away": "Buffalo Sabres"},
+             "call": "create", "arguments": {}},
+            {"id": {"sport": "Hockey", "event_group_name": "NHL",
+                    "start_time": "2021-06-01T12:00:00Z",
+                    "home": "BOS", "away": "Unknown"},
+             "call": "create", "arguments": {}},
+            {"call": "create"},
+        ]
+        response, body = self.request(
+            "POST", "/alice/normalize", incidents)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body[0]["incident"]["id"]["home"], "Boston Bruins")
+        self.assertEqual(body[1], dict(errors=[dict(
+            path=["id", "away"],
+            message="'Unknown' could not be normalized")]))
+        self.assertEqual(body[2]["errors"][0]["path"], ["id"])
+
+        response, body = self.request("POST", "/unknown/normalize", incidents)
+        self.assertEqual(response.status, 404)
+
+        # the unread body does not end up in the next request
+        response, body = self.request("GET", "/alice/sport?name=Hockey")
+        self.assertEqual(response.status, 200)
+
+    def test_invalid_start_time(self):
+        response, body = self.request(
+            "GET", "/alice/eventgroup?sport=Ice+Hockey&name=NHL"
+                   "&start_time=yesterday")
+        self.assertEqual(response.status, 400)
+        response, body = self.request(
+            "GET", "/alice/eventgroup?sport=Ice+Hockey&name=NHL"
+                   "&start_time=20191399")
+        self.assertEqual(response.status, 400)
+        response, body = self.request("GET", "/alice/sport?name=Hockey")
+        self.assertEqual(response.status, 200)
+
+    def test_post_root(self):
+        response, body = self.request("POST", "/", [])
+        self.assertEqual(response.status, 405)
+        self.assertTrue(response.will_close)
+
+        self.connection.close()
+        response, body = self.request("GET", "/alice/sport?name=Hockey")
+        self.assertEqual(response.status, 200)
+
+    def test_chain_loaded_once(self):
+        chain = self.server.chains["alice"]
+        bookiesports = chain.current()
+        self.request("GET", "/alice/sport?name=Hockey")
+        self.assertIs(chain.current(), bookiesports)
+
+        BookieSports("alice", override_cache=True)
+        self.request("GET", "/alice/sport?name=Hockey")
+        self.assertIsNot(chain.current(), bookiesports)
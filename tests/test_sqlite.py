@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+import unittest
+from bookiesports import BookieSports
+from bookiesports.normalize import IncidentsNormalizer
+from bookiesports.sqlite import export, SqliteLookup
+
+
+class Testcases(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.filename = os.path.join(cls.tmpdir, "alice.sqlite")
+        cls.bookiesports = BookieSports("alice")
+        export(cls.bookiesports, cls.filename)
+        cls.lookup = SqliteLookup(cls.filename)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.lookup.close()
+        shutil.rmtree(cls.tmpdir)
+
+    def test_meta(self):
+        self.assertEqual(self.lookup.chain, "alice")
+        self.assertEqual(self.lookup.chain_id, self.bookiesports.chain_id)
+
+    def test_participant_aliases_indexed(self):
+        plan = " ".join(row[-1] for row in self.lookup._db.execute(
+            "EXPLAIN QUERY PLAN SELECT alias FROM aliases "
+            "WHERE type = 'participant' AND source = 'alias' "
+            "AND ref = ? ORDER BY rowid", (1,)))
+        self.assertIn("aliases_ref", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_same_lookups_as_normalizer(self):
+        normalizer = IncidentsNormalizer("alice")
+        for sport in self.bookiesports.values():
+            for name in (sport.get("aliases") or []) + ["unknown sport"]:
+                self.assertEqual(
+                    self.lookup.get_sport_identifier(name),
+                    normalizer._get_sport_identifier(name))
+            for eventgroup in sport["eventgroups"].values():
+                for name in eventgroup.get("aliases") or []:
+                    for start_time in ["2021-06-01T12:00:00Z",
+                                       "2023-06-01T12:00:00Z"]:
+                        self.assertEqual(
+                            self.lookup.get_eventgroup_identifier(
+                                sport["identifier"], name, start_time),
+                            normalizer._get_eventgroup_identifier(
+                                sport["identifier"], name, start_time))
+            for participants in sport["participants"].values():
+                for participant in participants["participants"]:
+                    for name in participant.get("aliases") or []:
+                        self.assertEqual(
+                            self.lookup.get_participant_identifier(
+                                sport["identifier"], None, name),
+                            normalizer._get_participant_identifier(
+                                sport["identifier"], "", name))
+
+    def test_entities(self):
+        sport = self.lookup.get_sport("Ice Hockey")
+        self.assertEqual(sport["name"]["en"], "Ice Hockey")
+        eventgroup = self.lookup.get_eventgroup(
+            "Ice Hockey", "NHL Regular Season")
+        self.assertIn("NHL_HCP_1", eventgroup["bettingmarketgroups"])
+        participant = self.lookup.get_participant("Ice Hockey", "Boston Bruins")
+        self.assertIn("BOS", participant["aliases"])
+        self.assertIsNone(self.lookup.get_sport("Curling"))
+        self.assertIn(
+            ("Ice Hockey", "NHL Regular Season"),
+            self.lookup.eventgroups("Ice Hockey", at="2021-06-01T12:00:00Z"))
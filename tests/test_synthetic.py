@@ -0,0 +1,39 @@
+import shutil
+import tempfile
+import unittest
+from bookiesports import BookieSports
+from bookiesports.normalize import IncidentsNormalizer
+from bookiesports.synthetic import generate_chain, generate_incidents
+
+BASE_FOLDER = BookieSports.BASE_FOLDER
+
+
+class Testcases(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+        BookieSports.BASE_FOLDER = BASE_FOLDER
+        BookieSports.CHAIN_CACHE.pop("synthetic", None)
+
+    def test_generate(self):
+        generate_chain(
+            self.tmpdir, "synthetic", sports=2, eventgroups=3,
+            participants=4, aliases=2, rules=3, bettingmarketgroups=4)
+        # Validation happens inside
+        bookiesports = BookieSports(
+            "synthetic", sports_folder=self.tmpdir, override_cache=True)
+        self.assertEqual(len(bookiesports), 2)
+        sport = bookiesports["Sport0"]
+        self.assertEqual(len(sport["eventgroups"]), 3)
+        self.assertEqual(len(sport["rules"]), 3)
+        self.assertEqual(len(sport["bettingmarketgroups"]), 4)
+        self.assertEqual(
+            len(sport["participants"]["League0_Teams"]["participants"]), 4)
+
+        normalizer = IncidentsNormalizer("synthetic")
+        for incident in generate_incidents(bookiesports, 50):
+            normalized = normalizer.normalize(incident, errorIfNotFound=True)
+            self.assertIn("Team", normalized["id"]["home"])
@@ -0,0 +1,125 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from bookiesports import BookieSports
+from bookiesports.normalize import IncidentsNormalizer, NotFound
+from bookiesports.synthetic import generate_incidents
+
+THREADS = 8
+
+
+class Testcases(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def run_threads(self, target, count=THREADS):
+        errors = []
+
+        def run(i):
+            try:
+                target(i)
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+        threads = [
+            threading.Thread(target=run, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_normalizers_side_by_side(self):
+        chains = ["alice", "beatrice"]
+        incidents = dict(
+            (chain, generate_incidents(
+                BookieSports(chain), 300, miss_rate=0.2, seed=1))
+            for chain in chains)
+        expected = dict()
+        for chain in chains:
+            normalizer = IncidentsNormalizer(chain, cache_size=0)
+            expected[chain] = [
+                normalizer.normalize(i).to_dict() for i in incidents[chain]]
+
+        normalizers = []
+        for i in range(THREADS):
+            chain = chains[i % len(chains)]
+            normalizers.append((chain, IncidentsNormalizer(
+                chain, cache_size=64,
+                not_found_file=os.path.join(self.tmpdir, str(i)))))
+        results = dict()
+
+        def work(i):
+            chain, normalizer = normalizers[i]
+            results[i] = [
+                normalizer.normalize(incident).to_dict()
+                for incident in incidents[chain] * 3]
+        self.run_threads(work)
+
+        for i, (chain, normalizer) in enumerate(normalizers):
+            self.assertEqual(results[i], expected[chain] * 3)
+            with open(os.path.join(self.tmpdir, str(i))) as fid:
+                written = fid.read().splitlines()
+            self.assertEqual(sorted(written), sorted(normalizer.missing.keys()))
+            self.assertEqual(len(written), len(set(written)))
+            self.assertTrue(all(k.startswith(chain + "/") for k in written))
+
+    def test_shared_normalizer(self):
+        normalizer = IncidentsNormalizer("alice", cache_size=16)
+        incidents = generate_incidents(
+            BookieSports("alice"), 500, miss_rate=0.1, seed=2)
+        expected = [
+            normalizer.normalize(i).to_dict() for i in incidents]
+        results = dict()
+
+        def work(i):
+            if i == 0:
+                # reload the chain while the others normalize
+                BookieSports("alice", override_cache=True)
+            results[i] = [
+                normalizer.normalize(incident).to_dict()
+                for incident in incidents]
+        self.run_threads(work)
+        for result in results.values():
+            self.assertEqual(result, expected)
+
+    def test_stale_result_not_used(self):
+        normalizer = IncidentsNormalizer("alice")
+        incident = generate_incidents(BookieSports("alice"), 1, seed=3)[0]
+        expected = normalizer.normalize(incident).to_dict()
+        stale = normalizer.bookiesports
+
+        # a result resolved before the reload is put after it
+        BookieSports("alice", override_cache=True)
+        normalizer.refresh()
+        key = tuple(incident["id"][field] for field in (
+            "sport", "event_group_name", "home", "away", "start_time"))
+        normalizer._cache.put(key, (stale, ((None,) * 4, ())))
+
+        self.assertIsNot(normalizer.bookiesports, stale)
+        self.assertEqual(normalizer.normalize(incident).to_dict(), expected)
+
+    def test_use_chain(self):
+        filename = os.path.join(self.tmpdir, "missing")
+        try:
+            IncidentsNormalizer.use_chain("alice", not_found_file=filename)
+            normalizer = IncidentsNormalizer()
+        finally:
+            IncidentsNormalizer.use_chain(
+                "beatrice", not_found_file=None)
+        self.assertEqual(normalizer.bookiesports.chain, "alice")
+        self.assertEqual(normalizer.missing.filename, filename)
+        self.assertIsNone(IncidentsNormalizer().missing.filename)
+
+    def test_not_found_bounded(self):
+        missing = NotFound(maxsize=2)
+        self.assertTrue(missing.add("a"))
+        self.assertFalse(missing.add("a"))
+        missing.add("b")
+        missing.add("c")
+        self.assertEqual(missing.keys(), ["b", "c"])
@@ -0,0 +1,83 @@
+import unittest
+from bookiesports.exceptions import InvalidIncidentError
+from bookiesports.normalize import IncidentsNormalizer
+from bookiesports.validate import DEFAULT
+
+
+def incident(**id):
+    data = {
+        "sport": "Hockey",
+        "event_group_name": "NHL",
+        "start_time": "2021-06-01T12:00:00Z",
+        "home": "BOS",
+        "away": "Buffalo Sabres",
+    }
+    data.update(id)
+    return {"id": data, "call": "create", "arguments": {}}
+
+
+class Testcases(unittest.TestCase):
+
+    def paths(self, errors):
+        return [error.path for error in errors]
+
+    def test_valid(self):
+        self.assertEqual(DEFAULT.errors(incident()), [])
+        self.assertTrue(DEFAULT.is_valid(incident(start_time="20210601")))
+
+    def test_fast_errors(self):
+        self.assertEqual(self.paths(DEFAULT.errors(None)), [()])
+        self.assertEqual(
+            self.paths(DEFAULT.errors({"call": "create"})), [("id",)])
+
+        broken = incident(home=None, away="")
+        del broken["id"]["home"]
+        self.assertEqual(
+            self.paths(DEFAULT.errors(broken)),
+            [("id", "home"), ("id", "away")])
+        self.assertEqual(
+            self.paths(DEFAULT.errors(incident(start_time="yesterday"))),
+            [("id", "start_time")])
+        self.assertEqual(
+            self.paths(DEFAULT.errors(incident(sport=5))), [("id", "sport")])
+        # well formed, but no such date
+        for start_time in ["20191399", "2019-02-30T12:00:00Z"]:
+            self.assertEqual(
+                self.paths(DEFAULT.errors(incident(start_time=start_time))),
+                [("id", "start_time")])
+
+    def test_schema_errors(self):
+        broken = incident()
+        del broken["call"]
+        broken["arguments"] = []
+        self.assertEqual(
+            sorted(self.paths(DEFAULT.errors(broken))), [(), ("arguments",)])
+        # only the fields needed for normalization
+        self.assertEqual(DEFAULT.errors(broken, full=False), [])
+
+        with self.assertRaises(InvalidIncidentError) as cm:
+            DEFAULT.validate(broken)
+        self.assertEqual(len(cm.exception.errors), 2)
+
+    def test_normalize_many(self):
+        normalizer = IncidentsNormalizer("alice")
+        incidents = [
+            incident(),
+            {"id": "broken", "call": "create"},
+            incident(away="Unknown"),
+        ]
+        normalized, errors = normalizer.normalize_many(incidents)
+        self.assertEqual(normalized[0]["id"]["home"], "Boston Bruins")
+        self.assertIsNone(normalized[1])
+        self.assertEqual(normalized[2]["id"]["away"], "Unknown")
+        self.assertEqual(
+            [(e.index, e.path) for e in errors], [(1, ("id",))])
+        # rejected incidents never reach the lookups
+        self.assertEqual(normalizer.cache_info().currsize, 2)
+
+        normalized, errors = normalizer.normalize_many(
+            incidents, errorIfNotFound=True)
+        self.assertIsNone(normalized[2])
+        self.assertEqual(
+            [(e.index, e.path) for e in errors],
+            [(1, ("id",)), (2, ("id", "away"))])